@@ -25,7 +25,10 @@ class Application(models.Model):
     class Meta:
         constraints = [
             models.UniqueConstraint(fields=["job", "applicant"], name="unique_application")
-        ] 
+        ]
+        indexes = [
+            models.Index(fields=["job", "-applied_at"], name="application_job_recent_idx"),
+        ]
 
     def __str__(self):
         return f"{self.applicant.email} applied for {self.job.title}"
\ No newline at end of file
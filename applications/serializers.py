@@ -8,7 +8,7 @@ class AppJobSerializer(serializers.ModelSerializer):
     """Serializer to display job details instead of just the job ID"""
     class Meta:
         model = Job
-        exclude = ["industry", "category", "posted_by"]
+        exclude = ["industry", "category", "posted_by", "search_vector"]
 
 class ApplicantSerializer(serializers.ModelSerializer):
     class Meta:
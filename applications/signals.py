@@ -0,0 +1,25 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from jobs.caching import clear_job_caches
+from jobs.models import Job, EmployerStats
+from .models import Application
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def clear_cached_applicant_counts(sender, instance, **kwargs):
+    """Job listings and details show applicant counts."""
+    clear_job_caches(instance.job_id)
+
+
+@receiver(post_save, sender=Application)
+def count_application(sender, instance, created, **kwargs):
+    if created:
+        EmployerStats.increment(instance.job.posted_by_id, "applicants_count")
+
+
+@receiver(post_delete, sender=Application)
+def uncount_application(sender, instance, **kwargs):
+    # Cascaded deletes remove applications before their job, so the job row is still readable here.
+    posted_by_id = Job.objects.filter(pk=instance.job_id).values_list("posted_by_id", flat=True).first()
+    if posted_by_id is not None:
+        EmployerStats.decrement(posted_by_id, "applicants_count")
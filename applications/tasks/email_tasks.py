@@ -46,5 +46,5 @@ def send_job_application_email(self, recipient_email: str, first_name: str, job_
         logger.info(f"Successfully sent job application email to {recipient_email}")
 
     except Exception as e:
-        logger.error(f"Failed to send job application email to {recipient_email}: {str(e)}")
+        logger.exception("Failed to send job application email to %s", recipient_email)
         raise self.retry(exc=e, countdown=2 ** self.request.retries)
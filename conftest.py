@@ -0,0 +1,20 @@
+import os
+import pytest
+
+
+def pytest_configure(config):
+    """Use a fast password hasher and a per-worker cache namespace for the test run."""
+    from django.conf import settings
+
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    # xdist workers share one Redis database; a key prefix per worker keeps their caches apart.
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    settings.CACHES["default"]["KEY_PREFIX"] = f"test:{worker}"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache; the pattern is scoped to this worker's key prefix."""
+    from django.core.cache import cache
+
+    cache.delete_pattern("*")
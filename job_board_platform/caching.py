@@ -0,0 +1,46 @@
+import hashlib
+from django.core.cache import cache
+
+CACHE_KEY_VERSION = 1
+LOCK_TIMEOUT = 10
+STALE_TIMEOUT = 600
+
+
+def make_cache_key(prefix, *parts):
+    """Build a short, fixed-length cache key from a tuple of request parameters.
+
+    Hashing the tuple's repr keeps keys collision-free even when a part
+    (e.g. a search term) contains the separator characters.
+    """
+    raw = repr((CACHE_KEY_VERSION, *parts)).encode()
+    return prefix + hashlib.blake2b(raw, digest_size=12).hexdigest()
+
+
+def get_or_set_with_stale(key, compute, timeout=120, stale_timeout=STALE_TIMEOUT):
+    """Return the cached value for `key`, recomputing it at most once at a time.
+
+    On a miss, only the caller that wins a short `cache.add` lock runs `compute`
+    and stores the result; concurrent callers are served the longer-lived stale
+    copy when there is one, and otherwise compute without touching the lock.
+    The stale copy lives under its own prefix so pattern deletes of `key` keep it.
+    """
+    data = cache.get(key)
+    if data is not None:
+        return data
+
+    stale_key = f"stale:{key}"
+    lock_key = f"lock:{key}"
+    if not cache.add(lock_key, 1, LOCK_TIMEOUT):
+        data = cache.get(stale_key)
+        if data is not None:
+            return data
+        # The lock belongs to the caller that won it; only that caller may release it.
+        return compute()
+
+    try:
+        data = compute()
+        cache.set(key, data, timeout=timeout)
+        cache.set(stale_key, data, timeout=stale_timeout)
+    finally:
+        cache.delete(lock_key)
+    return data
@@ -0,0 +1,26 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import exception_handler
+
+
+def handle_django_validation_error(exc, context):
+    """Return model-level validation errors (e.g. from `Model.clean`) as a 400 response."""
+    detail = exc.message_dict if hasattr(exc, "error_dict") else {"error": exc.messages}
+    return Response(detail, status=status.HTTP_400_BAD_REQUEST)
+
+
+EXCEPTION_HANDLERS = {
+    DjangoValidationError: handle_django_validation_error,
+}
+
+
+def custom_exception_handler(exc, context):
+    """Dispatch exceptions DRF does not know about by type, then fall back to DRF's handler.
+
+    Anything still unhandled propagates to `ExceptionMiddleware`, which logs it and returns a 500.
+    """
+    handler = EXCEPTION_HANDLERS.get(type(exc))
+    if handler is not None:
+        return handler(exc, context)
+    return exception_handler(exc, context)
@@ -0,0 +1,49 @@
+import re
+from django.contrib.postgres.search import SearchQuery
+from django.utils.encoding import force_str
+from rest_framework.compat import coreapi, coreschema
+from rest_framework.filters import BaseFilterBackend
+
+
+class SearchVectorFilter(BaseFilterBackend):
+    """Filter on the model's trigger-maintained, GIN-indexed `search_vector` column.
+
+    Every word in the `search` parameter is prefix-matched, so partial words ("dev")
+    still match ("developer"). The `simple` config keeps short words such as "IT"
+    that the English config would drop as stopwords.
+    """
+    search_param = "search"
+    search_config = "simple"
+    search_title = "Search"
+    search_description = "A search term."
+
+    def filter_queryset(self, request, queryset, view):
+        terms = re.findall(r"\w+", request.query_params.get(self.search_param, ""))
+        if not terms:
+            return queryset
+
+        tsquery = " & ".join(f"{term}:*" for term in terms)
+        return queryset.filter(search_vector=SearchQuery(tsquery, config=self.search_config, search_type="raw"))
+
+    def get_schema_fields(self, view):
+        if coreapi is None or coreschema is None:
+            return []
+        return [
+            coreapi.Field(
+                name=self.search_param,
+                required=False,
+                location="query",
+                schema=coreschema.String(title=force_str(self.search_title), description=force_str(self.search_description)),
+            )
+        ]
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": force_str(self.search_description),
+                "schema": {"type": "string"},
+            }
+        ]
@@ -0,0 +1,93 @@
+import atexit
+import logging
+import orjson
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+_log_queue = queue.SimpleQueue()
+_listener = None
+
+REQUEST_LOG_PATH = "requests.log"
+REQUEST_LOG_BATCH_SIZE = 256
+REQUEST_LOG_FLUSH_INTERVAL = 0.05
+_request_log_queue = queue.SimpleQueue()
+_request_log_fd = None
+_request_log_lock = threading.Lock()
+
+
+def _start_listener():
+    """Start the single background thread that writes queued records to the console."""
+    global _listener
+    if _listener is not None:
+        return
+
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    _listener = QueueListener(_log_queue, console, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+class AsyncQueueHandler(QueueHandler):
+    """Logging handler that only enqueues records so request threads never block on log I/O."""
+
+    def __init__(self):
+        super().__init__(_log_queue)
+        _start_listener()
+
+
+def _drain_request_log(batch):
+    """Pull queued records into ``batch`` until it is full or the flush interval has passed."""
+    deadline = time.monotonic() + REQUEST_LOG_FLUSH_INTERVAL
+    while len(batch) < REQUEST_LOG_BATCH_SIZE:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(_request_log_queue.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return batch
+
+
+def encode_request_log(record):
+    """Serialize a request record, expanding its ``timestamp`` from epoch nanoseconds to ISO-8601."""
+    record["timestamp"] = datetime.fromtimestamp(record["timestamp"] / 1e9).isoformat()
+    return orjson.dumps(record)
+
+
+def _write_request_log(batch):
+    os.write(_request_log_fd, b"".join(encode_request_log(record) + b"\n" for record in batch))
+
+
+def _run_request_log_writer():
+    while True:
+        _write_request_log(_drain_request_log([_request_log_queue.get()]))
+
+
+def _flush_request_log():
+    batch = []
+    while True:
+        try:
+            batch.append(_request_log_queue.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        _write_request_log(batch)
+
+
+def enqueue_request_log(record):
+    """Queue one request record for ``requests.log``; a background thread serializes and appends them in batches."""
+    global _request_log_fd
+    if _request_log_fd is None:
+        with _request_log_lock:
+            if _request_log_fd is None:
+                # O_APPEND keeps each batch write atomic across worker processes.
+                _request_log_fd = os.open(REQUEST_LOG_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                threading.Thread(target=_run_request_log_writer, name="request-log-writer", daemon=True).start()
+                atexit.register(_flush_request_log)
+    _request_log_queue.put(record)
@@ -0,0 +1,21 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+class OrjsonRenderer(JSONRenderer):
+    """JSONRenderer that encodes with orjson.
+
+    Types orjson does not know (Decimal, lazy strings, querysets...) go through DRF's encoder,
+    and indented output (e.g. for the browsable API) is left to the stdlib renderer.
+    """
+    _default = staticmethod(JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(data, default=self._default, option=ORJSON_OPTIONS)
@@ -65,6 +65,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'django_celery_results',
     'whitenoise.runserver_nostatic',
     'rest_framework_simplejwt.token_blacklist',
@@ -104,8 +105,7 @@ REST_FRAMEWORK = {
         'rest_framework.parsers.FormParser',
     ),
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ],
      'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
@@ -114,6 +114,25 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
+    'EXCEPTION_HANDLER': 'job_board_platform.exceptions.custom_exception_handler',
+}
+
+LOG_LEVEL = env('LOG_LEVEL', default='WARNING')
+REQUEST_LOG_FILE_ENABLED = env.bool('REQUEST_LOG_FILE_ENABLED', default=False)
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'queue': {
+            'class': 'job_board_platform.logging_handlers.AsyncQueueHandler',
+            'level': LOG_LEVEL,
+        },
+    },
+    'root': {
+        'handlers': ['queue'],
+        'level': LOG_LEVEL,
+    },
 }
 
 TEMPLATES = [
@@ -218,6 +237,13 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'Africa/Lagos'
+CELERY_IMPORTS = ('users.tasks.email_tasks', 'users.tasks.user_tasks', 'applications.tasks.email_tasks')
+CELERY_BEAT_SCHEDULE = {
+    'flush-email-outbox': {
+        'task': 'users.tasks.email_tasks.flush_email_outbox',
+        'schedule': 2.0,
+    },
+}
 
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = env('EMAIL_HOST', default='smtp.gmail.com')
@@ -226,6 +252,8 @@ EMAIL_USE_TLS = env('EMAIL_USE_TLS', default=False)
 EMAIL_USE_SSL = env('EMAIL_USE_SSL', default=True) 
 EMAIL_HOST_USER = env('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = env('EMAIL_HOST_PASSWORD')
+# Seconds each blocking SMTP operation may take; bounds how long an outbox flush can run.
+EMAIL_TIMEOUT = env.int('EMAIL_TIMEOUT', default=10)
 DEFAULT_FROM_EMAIL = env('DEFAULT_FROM_EMAIL')
 SUPPORT_EMAIL = env('SUPPORT_EMAIL')
 
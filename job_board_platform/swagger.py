@@ -0,0 +1,10 @@
+from drf_yasg import openapi
+
+MESSAGE_RESPONSE = openapi.Response(
+    "Created successfully.",
+    schema=openapi.Schema(type=openapi.TYPE_OBJECT, properties={"message": openapi.Schema(type=openapi.TYPE_STRING)}),
+)
+ERROR_RESPONSE = openapi.Response(
+    "Validation error (e.g., already created).",
+    schema=openapi.Schema(type=openapi.TYPE_OBJECT, properties={"error": openapi.Schema(type=openapi.TYPE_STRING)}),
+)
@@ -0,0 +1,20 @@
+from django.core.cache import cache
+
+JOB_LIST_CACHE_PREFIX = "jl:"
+JOB_DETAIL_CACHE_PREFIX = "job_"
+CATEGORIZED_JOBS_CACHE_PREFIX = "catjobs:"
+
+
+def job_detail_cache_key(job_id):
+    return f"{JOB_DETAIL_CACHE_PREFIX}{job_id}"
+
+
+def clear_job_caches(job_id=None):
+    """Drop the cached job list and categorized-jobs pages, plus one job's detail when given.
+
+    All of them render applicant counts and industry/category names, so they are cleared together.
+    """
+    cache.delete_pattern(f"{JOB_LIST_CACHE_PREFIX}*")
+    cache.delete_pattern(f"{CATEGORIZED_JOBS_CACHE_PREFIX}*")
+    if job_id is not None:
+        cache.delete(job_detail_cache_key(job_id))
@@ -0,0 +1,66 @@
+# Generated by Django 4.2.16 on 2026-10-16 09:12
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+JOB_SEARCH_VECTOR_SQL = """
+CREATE OR REPLACE FUNCTION jobs_job_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('pg_catalog.simple', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('pg_catalog.simple', coalesce(NEW.type::text, '')), 'B') ||
+        setweight(to_tsvector('pg_catalog.simple', coalesce(NEW.location, '')), 'B') ||
+        setweight(to_tsvector('pg_catalog.simple', coalesce(
+            (SELECT name FROM jobs_industry WHERE id = NEW.industry_id), ''
+        )), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER jobs_job_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, type, location, industry_id ON jobs_job
+    FOR EACH ROW EXECUTE FUNCTION jobs_job_search_vector_update();
+
+CREATE OR REPLACE FUNCTION jobs_industry_search_vector_sync() RETURNS trigger AS $$
+BEGIN
+    UPDATE jobs_job SET industry_id = industry_id WHERE industry_id = NEW.id;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER jobs_industry_search_vector_trigger
+    AFTER UPDATE OF name ON jobs_industry
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION jobs_industry_search_vector_sync();
+
+UPDATE jobs_job SET title = title;
+"""
+
+DROP_JOB_SEARCH_VECTOR_SQL = """
+DROP TRIGGER IF EXISTS jobs_industry_search_vector_trigger ON jobs_industry;
+DROP FUNCTION IF EXISTS jobs_industry_search_vector_sync();
+DROP TRIGGER IF EXISTS jobs_job_search_vector_trigger ON jobs_job;
+DROP FUNCTION IF EXISTS jobs_job_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0008_alter_job_picture'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='job_search_vector_gin'),
+        ),
+        migrations.RunSQL(JOB_SEARCH_VECTOR_SQL, DROP_JOB_SEARCH_VECTOR_SQL),
+    ]
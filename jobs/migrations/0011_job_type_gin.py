@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-16 10:41
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0010_job_location_trgm'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['type'], name='job_type_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
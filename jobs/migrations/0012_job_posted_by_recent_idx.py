@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2026-10-16 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0011_job_type_gin'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['posted_by', '-posted_at'], name='job_posted_by_recent_idx'),
+        ),
+    ]
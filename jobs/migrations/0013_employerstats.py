@@ -0,0 +1,43 @@
+# Generated by Django 4.2.16 on 2026-10-16 12:05
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+
+def backfill_employer_stats(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    Application = apps.get_model('applications', 'Application')
+    EmployerStats = apps.get_model('jobs', 'EmployerStats')
+
+    stats = {}
+    for row in Job.objects.values('posted_by').annotate(total=Count('id')):
+        stats.setdefault(row['posted_by'], EmployerStats(user_id=row['posted_by'])).jobs_count = row['total']
+    for row in Application.objects.values('job__posted_by').annotate(total=Count('id')):
+        stats.setdefault(row['job__posted_by'], EmployerStats(user_id=row['job__posted_by'])).applicants_count = row['total']
+    EmployerStats.objects.bulk_create(stats.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('applications', '0003_application_job_recent_idx'),
+        ('jobs', '0012_job_posted_by_recent_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmployerStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='employer_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('jobs_count', models.PositiveIntegerField(default=0)),
+                ('applicants_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'Employer stats',
+            },
+        ),
+        migrations.RunPython(backfill_employer_stats, migrations.RunPython.noop),
+    ]
@@ -5,8 +5,30 @@ from users.models import User
 from django.core.exceptions import ValidationError
 from cloudinary.models import CloudinaryField
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 
-class Industry(models.Model):
+class CachedLookupMixin:
+    """Cache primary-key lookups for small, rarely-modified tables."""
+    cache_timeout = 60 * 60
+
+    @classmethod
+    def cache_key_for(cls, pk):
+        return f"{cls._meta.model_name}:{pk}"
+
+    @classmethod
+    def get_cached(cls, pk):
+        """Return the instance with the given primary key, hitting the database only on a cache miss.
+
+        Entries are dropped by post_save/post_delete receivers in jobs.signals, which also fire for
+        cascaded deletes.
+        """
+        return cache.get_or_set(cls.cache_key_for(pk), lambda: cls.objects.get(pk=pk), cls.cache_timeout)
+
+
+class Industry(CachedLookupMixin, models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, unique=True, editable=False)
     name = models.CharField(max_length=255, unique=True, db_index=True)
     description = models.TextField(null=True, blank=True)
@@ -19,7 +41,7 @@ class Industry(models.Model):
         return self.name
 
 
-class Category(models.Model):
+class Category(CachedLookupMixin, models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, unique=True, editable=False)
     name = models.CharField(max_length=255, unique=True, db_index=True)
     industry = models.ForeignKey(Industry, on_delete=models.CASCADE, related_name="industries")
@@ -64,6 +86,16 @@ class Job(models.Model):
     else:
         picture = CloudinaryField("image", null=True, blank=True)
 
+    # Maintained by a database trigger from title, type, location and industry name.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="job_search_vector_gin"),
+            GinIndex(fields=["location"], name="job_location_trgm", opclasses=["gin_trgm_ops"]),
+            GinIndex(fields=["type"], name="job_type_gin", opclasses=["jsonb_path_ops"]),
+            models.Index(fields=["posted_by", "-posted_at"], name="job_posted_by_recent_idx"),
+        ]
 
     def __str__(self):
         return self.title
@@ -92,4 +124,32 @@ class Job(models.Model):
     def save(self, *args, **kwargs):
         """Run clean method before saving the object."""
         self.clean()
-        super().save(*args, **kwargs)
\ No newline at end of file
+        super().save(*args, **kwargs)
+
+class EmployerStats(models.Model):
+    """Dashboard counters for the jobs an employer/admin has posted, kept current by signals."""
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="employer_stats")
+    jobs_count = models.PositiveIntegerField(default=0)
+    applicants_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = "Employer stats"
+
+    def __str__(self):
+        return f"Stats for {self.user_id}"
+
+    @classmethod
+    def for_user(cls, user_id):
+        """Return the user's counters, or zeroed counters if nothing has been posted yet."""
+        return cls.objects.filter(user_id=user_id).first() or cls(user_id=user_id)
+
+    @classmethod
+    def increment(cls, user_id, field):
+        if not cls.objects.filter(user_id=user_id).update(**{field: F(field) + 1}):
+            _, created = cls.objects.get_or_create(user_id=user_id, defaults={field: 1})
+            if not created:
+                cls.objects.filter(user_id=user_id).update(**{field: F(field) + 1})
+
+    @classmethod
+    def decrement(cls, user_id, field):
+        cls.objects.filter(user_id=user_id, **{f"{field}__gt": 0}).update(**{field: F(field) - 1})
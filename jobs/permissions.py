@@ -1,5 +1,7 @@
 from rest_framework import permissions
 
+JOB_POSTER_ROLES = frozenset(("admin", "employer"))
+
 class ReadOnlyModifyByAdminEmployer(permissions.BasePermission):
     """
     - Allow all users (authenticated or not) to view (GET).
@@ -33,26 +35,6 @@ class ReadOnlyModifyByAdminEmployer(permissions.BasePermission):
             return True
 
 
-class ReadCreateOnlyAdminModify(permissions.BasePermission):
-    """
-    - User can only create and list job applications
-    - Employer can only see applications (applicants) for jobs they posted
-    - Admin have all access to CRUD  
-    """
-
-    def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated
-        
-    def has_object_permission(self, request, view, obj):
-        if request.user.is_superuser:
-            return True
-        
-        if request.method in permissions.SAFE_METHODS:
-            return hasattr(obj, "job") and obj.job.posted_by == request.user
-        if request.method in ["POST", "GET"]:
-            return hasattr(obj, 'applicant') and obj.applicant == request.user
-        return False
-
 class ReadOnlyAdminModify(permissions.BasePermission):
     """
         - View only access for all
@@ -81,12 +63,4 @@ class IsAdminAndEmployer(permissions.BasePermission):
         if request.user.is_superuser:
             return True
         
-        return getattr(request.user, "role", None) in ["admin", "employer"]
-        
-                
-class IsOnlyAdmin(permissions.BasePermission):
-    """Allows access only to superadmins or users with the 'admin' role."""
-    def has_permission(self, request, view):
-        return request.user and request.user.is_authenticated and (
-            request.user.is_superuser or getattr(request.user, "role", None) == "admin"
-        )
\ No newline at end of file
+        return getattr(request.user, "role", None) in JOB_POSTER_ROLES
@@ -4,8 +4,38 @@ from applications.models import Application
 import json
 from django.conf import settings
 from users.models import User
+from django.core.exceptions import ObjectDoesNotExist, ValidationError as DjangoValidationError
 
 
+CLOUDINARY_URL_PREFIX = f"https://res.cloudinary.com/{getattr(settings, 'CLOUDINARY_CLOUD_NAME', 'temz-cloudinary')}/"
+
+
+def get_absolute_picture_url(picture_url, request=None):
+    """Return absolute URL for job picture based on environment."""
+    if not picture_url:
+        return None
+
+    if settings.DEBUG:
+        return request.build_absolute_uri(picture_url) if request else picture_url
+    if not picture_url.startswith("http"):
+        return CLOUDINARY_URL_PREFIX + picture_url
+    return picture_url
+
+
+class CachedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """Resolve related primary keys through the model's lookup cache when it has one."""
+
+    def to_internal_value(self, data):
+        model = self.get_queryset().model
+        if not hasattr(model, "get_cached"):
+            return super().to_internal_value(data)
+        try:
+            return model.get_cached(data)
+        except ObjectDoesNotExist:
+            self.fail('does_not_exist', pk_value=data)
+        except (TypeError, ValueError, DjangoValidationError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
 
 class IndustrySerializer(serializers.ModelSerializer):
     class Meta:
@@ -23,23 +53,36 @@ class CategoryIndustrySerializer(serializers.ModelSerializer):
         fields = ('id', 'name')
 
 class JobListSerializer(serializers.ModelSerializer):
-    industry = serializers.CharField(source="industry.name", read_only=True)
-    category = serializers.CharField(source="category.name", read_only=True)
+    industry = serializers.SerializerMethodField()
+    category = serializers.SerializerMethodField()
     posted_by = serializers.CharField(source="posted_by.email", read_only=True)
     no_of_applicants = serializers.SerializerMethodField()
+    picture = serializers.SerializerMethodField()
     class Meta:
         model = Job
-        fields = "__all__"
+        exclude = ["search_vector"]
+
+    def get_picture(self, obj):
+        if not obj.picture:
+            return None
+        return get_absolute_picture_url(obj.picture.url, self.context.get("request"))
+
+    def get_industry(self, obj):
+        return obj.industry.name if obj.industry else None
+
+    def get_category(self, obj):
+        return obj.category.name if obj.category else None
         
     def get_no_of_applicants(self, obj):
         return Application.objects.filter(job=obj).count()
 
 class JobSerializer(serializers.ModelSerializer):
+    serializer_related_field = CachedPrimaryKeyRelatedField
     no_of_applicants = serializers.SerializerMethodField()
 
     class Meta:
         model = Job
-        fields = '__all__'
+        exclude = ["search_vector"]
         extra_kwargs = {
             'industry': {'required': True},
             'category': {'required': True},
@@ -55,7 +98,7 @@ class JobSerializer(serializers.ModelSerializer):
         category = data.get("category")
 
         if category and industry:
-            if not Category.objects.filter(id=category.id, industry=industry).exists():
+            if category.industry_id != industry.id:
                 raise serializers.ValidationError(
                     {"category": f"The {category.name} category does not belong to the specified industry, {industry.name}."}
                 )
@@ -85,6 +128,6 @@ class JobSerializer(serializers.ModelSerializer):
         data["type"] = data["type"] or []
         
         if instance.picture:
-            data["picture"] = instance.picture.url
+            data["picture"] = get_absolute_picture_url(instance.picture.url, self.context.get("request"))
         
         return data
\ No newline at end of file
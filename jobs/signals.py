@@ -0,0 +1,32 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .caching import clear_job_caches
+from .models import Job, EmployerStats, Industry, Category
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def clear_cached_job(sender, instance, **kwargs):
+    clear_job_caches(instance.pk)
+
+
+@receiver(post_save, sender=Industry)
+@receiver(post_delete, sender=Industry)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def clear_lookup_cache(sender, instance, **kwargs):
+    """Drop the cached lookup; deleting an Industry sends post_delete for each cascaded Category too."""
+    cache.delete(sender.cache_key_for(instance.pk))
+    # Job listings render industry and category names.
+    clear_job_caches()
+
+
+@receiver(post_save, sender=Job)
+def count_posted_job(sender, instance, created, **kwargs):
+    if created:
+        EmployerStats.increment(instance.posted_by_id, "jobs_count")
+
+
+@receiver(post_delete, sender=Job)
+def uncount_posted_job(sender, instance, **kwargs):
+    EmployerStats.decrement(instance.posted_by_id, "jobs_count")
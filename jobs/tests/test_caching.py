@@ -0,0 +1,39 @@
+import pytest
+from django.core.cache import cache
+from job_board_platform.caching import get_or_set_with_stale
+
+KEY = "test:stampede"
+
+
+@pytest.fixture(autouse=True)
+def clear_keys():
+    cache.delete_many([KEY, f"stale:{KEY}", f"lock:{KEY}"])
+    yield
+    cache.delete_many([KEY, f"stale:{KEY}", f"lock:{KEY}"])
+
+
+class TestGetOrSetWithStale:
+
+    def test_only_the_lock_winner_releases_the_lock(self):
+        seen = {}
+
+        def loser_compute():
+            return "loser"
+
+        def winner_compute():
+            # A second caller misses while the winner still holds the lock.
+            seen["loser_result"] = get_or_set_with_stale(KEY, loser_compute)
+            seen["lock_after_loser"] = cache.get(f"lock:{KEY}")
+            return "winner"
+
+        assert get_or_set_with_stale(KEY, winner_compute) == "winner"
+        assert seen["loser_result"] == "loser"
+        assert seen["lock_after_loser"] == 1
+        assert cache.get(f"lock:{KEY}") is None
+        assert cache.get(KEY) == "winner"
+
+    def test_loser_is_served_the_stale_copy(self):
+        cache.set(f"stale:{KEY}", "stale")
+        cache.add(f"lock:{KEY}", 1)
+        assert get_or_set_with_stale(KEY, lambda: "fresh") == "stale"
+        assert cache.get(f"lock:{KEY}") == 1
@@ -213,6 +213,12 @@ class TestCategoryViewSet:
 
         assert response.status_code == status.HTTP_201_CREATED
         assert Category.objects.filter(name="Software").exists()
+
+    def test_cascaded_category_delete_clears_lookup_cache(self, category, industry):
+        Category.get_cached(category.pk)
+        industry.delete()
+        with pytest.raises(Category.DoesNotExist):
+            Category.get_cached(category.pk)
         
     def test_user_create_category(self, auth_client_user, industry, user):
         url = reverse("category-list")
@@ -290,6 +296,25 @@ class TestJobViewSet:
         assert "NY" in response.json()
         assert "CA" in response.json()
 
+    def test_categorized_jobs_applicant_count_follows_new_applications(self, api_client, admin, user, industry, category):
+        job = Job.objects.create(title="Backend Engineer", industry=industry, category=category, location="NY", type=["full-time"], posted_by=admin)
+        url = reverse("job-list") + "categorized-jobs/?category=location"
+        assert api_client.get(url).json()["NY"]["jobs"][0]["no_of_applicants"] == 0
+
+        Application.objects.create(job=job, applicant=user)
+        assert api_client.get(url).json()["NY"]["jobs"][0]["no_of_applicants"] == 1
+
+    def test_filtered_categorized_jobs_report_total_on_later_pages(self, api_client, admin, industry, category):
+        for index in range(3):
+            Job.objects.create(title=f"Engineer {index}", industry=industry, category=category, location="NY", type=["full-time"], posted_by=admin)
+
+        url = reverse("job-list") + "categorized-jobs/?category=location&filter=NY&page_size=2&page=2"
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["NY"]["total_count"] == 3
+        assert len(response.json()["NY"]["jobs"]) == 1
+
     def test_get_job_applicants_by_user(self, api_client, admin, user, industry, category):
         """Get applicants of a job without unauthorized"""
         job = Job.objects.create(title="Data Scientist", industry=industry, category=category, location="Remote", type=["full-time"], posted_by=admin)
@@ -381,6 +406,20 @@ class TestJobViewSet:
         assert response.status_code == status.HTTP_200_OK
         assert response.json()["all_applicants"] == 2
         
+    def test_total_applicants_after_job_deleted(self, auth_client_admin, admin, user, industry, category):
+        """Test the employer's counters drop when a job and its applications are deleted."""
+        job1 = Job.objects.create(title="Data Scientist", industry=industry, category=category, location="Remote", type=["full-time"], posted_by=admin)
+        job2 = Job.objects.create(title="Backend Engineer", industry=industry, category=category, location="NY", type=["full-time"],  posted_by=admin)
+        Application.objects.create(job=job1, applicant=user)
+        Application.objects.create(job=job2, applicant=user)
+        job1.delete()
+
+        response = auth_client_admin.get(reverse("job-list") + "total-applicants/")
+        assert response.json()["all_applicants"] == 1
+
+        response = auth_client_admin.get(reverse("job-list") + "total-jobs/")
+        assert response.json()["total_jobs"] == 1
+
     def test_total_applicants_unauthenticated(self, api_client):
         """Test user cannot gets the total number of applicants as they cant post jobs."""
         url = reverse("job-list") + "total-applicants/"
@@ -397,4 +436,25 @@ class TestJobViewSet:
         
         response = auth_client_user.get(url)
 
-        assert response.status_code == status.HTTP_403_FORBIDDEN
\ No newline at end of file
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_search_jobs_by_prefix(self, api_client, admin, industry, category):
+        """Test job search matches partial words across title, location and industry."""
+        Job.objects.create(title="Backend Developer", industry=industry, category=category, location="Lagos", type=["full-time"], posted_by=admin)
+        Job.objects.create(title="Accountant", industry=industry, category=category, location="Abuja", type=["contract"], posted_by=admin)
+
+        url = reverse("job-list") + "?search=dev"
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [job["title"] for job in response.json()["results"]] == ["Backend Developer"]
+
+    def test_search_jobs_by_stopword_industry(self, api_client, admin, user):
+        """Test short industry names such as "IT" are not dropped as stopwords."""
+        it_industry = Industry.objects.create(name="IT", created_by=user)
+        Job.objects.create(title="Support Engineer", industry=it_industry, location="Lagos", type=["full-time"], posted_by=admin)
+
+        response = api_client.get(reverse("job-list"), {"search": "IT"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [job["title"] for job in response.json()["results"]] == ["Support Engineer"]
@@ -1,7 +1,5 @@
-import traceback
-from django.conf import settings
-from rest_framework import viewsets, filters, serializers, status
-from .models import Job, Industry, Category
+from rest_framework import viewsets, filters, status
+from .models import Job, Industry, Category, EmployerStats
 from django.db.models import Count
 from applications.models import Application
 from applications.serializers import ApplicationSerializer, AppJobSerializer
@@ -10,23 +8,30 @@ from .permissions import (
     ReadOnlyModifyByAdminEmployer,
     ReadOnlyAdminModify,
     IsAdminAndEmployer,
-    IsOnlyAdmin
 )
+from users.permissions import IsOnlyAdmin
 from .pagination import CustomPagination
+from job_board_platform.filters import SearchVectorFilter
+from .caching import JOB_LIST_CACHE_PREFIX, CATEGORIZED_JOBS_CACHE_PREFIX, job_detail_cache_key
+from job_board_platform.caching import make_cache_key, get_or_set_with_stale
+from job_board_platform.swagger import MESSAGE_RESPONSE, ERROR_RESPONSE
 from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
-from django.core.cache import cache
 import logging
+from django.core.cache import cache
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from collections import defaultdict
-from django.core.paginator import Paginator
-from django.db.models import F, Q
-from django.core.exceptions import ValidationError
+from django.db.models import F, Q, Prefetch, Value, Window, OuterRef, Subquery, IntegerField
+from django.db.models.functions import Coalesce, NullIf, RowNumber
 
 
 logger = logging.getLogger(__name__)
 
+CATEGORIZED_JOBS_COUNT_TIMEOUT = 300
+
+
 class IndustryViewSet(viewsets.ModelViewSet):
     """API endpoint for performing CRUD functions on industries with paginated jobs."""
     queryset = Industry.objects.all().order_by('-created_at')
@@ -52,8 +57,8 @@ class IndustryViewSet(viewsets.ModelViewSet):
         operation_description="API that allows only admins create new industry.",
         request_body=IndustrySerializer,
         responses={
-            201: openapi.Response("Created submitted successfully.", schema=openapi.Schema(type=openapi.TYPE_OBJECT, properties={"message": openapi.Schema(type=openapi.TYPE_STRING)})),
-            400: openapi.Response("Validation error (e.g., already created).", schema=openapi.Schema(type=openapi.TYPE_OBJECT, properties={"error": openapi.Schema(type=openapi.TYPE_STRING)})),
+            201: MESSAGE_RESPONSE,
+            400: ERROR_RESPONSE,
         }
     )
     def create(self, request, *args, **kwargs):
@@ -134,7 +139,7 @@ class IndustryViewSet(viewsets.ModelViewSet):
         if not jobs.exists():
             return Response({"message": "No jobs found in this industry."}, status=status.HTTP_404_NOT_FOUND)
 
-        paginator = CustomPagination()
+        paginator = self.paginator
         paginated_jobs = paginator.paginate_queryset(jobs, request)
         
         serializer = JobSerializer(paginated_jobs, many=True)
@@ -183,7 +188,7 @@ class IndustryViewSet(viewsets.ModelViewSet):
         if not categories.exists():
             return Response({"message": "No categories found for this industry."}, status=status.HTTP_200_OK)
 
-        paginator = CustomPagination()
+        paginator = self.paginator
         paginated_categories = paginator.paginate_queryset(categories, request)
         
         serializer = CategorySerializer(paginated_categories, many=True)
@@ -224,7 +229,7 @@ class IndustryViewSet(viewsets.ModelViewSet):
         all_industries = Industry.objects.filter(created_by=user).order_by('-created_at')
         if not all_industries.exists():
             return Response({"message": "No industries available."}, status=status.HTTP_200_OK)
-        paginator = CustomPagination()
+        paginator = self.paginator
         result_page = paginator.paginate_queryset(all_industries, request)
         serialized_data = IndustrySerializer(result_page, many=True).data
         return paginator.get_paginated_response(serialized_data)
@@ -274,21 +279,23 @@ class IndustryViewSet(viewsets.ModelViewSet):
     def get_categories_by_industry(self, request):
         """Get all categories created by the current admin and group them by industry."""
         user = request.user 
-        categories = Category.objects.filter(created_by=user).select_related("industry")
-
-        industry_categories = defaultdict(list)
-        for category in categories:
-            industry_categories[category.industry].append(category)
+        industries = (
+            Industry.objects.filter(industries__created_by=user)
+            .distinct()
+            .order_by("name")
+            .prefetch_related(
+                Prefetch("industries", queryset=Category.objects.filter(created_by=user), to_attr="admin_categories")
+            )
+        )
 
-        grouped_data = []
-        for industry, category_list in industry_categories.items():
-            grouped_data.append({
+        paginator = self.paginator
+        paginated_result = [
+            {
                 "industry": IndustrySerializer(industry).data,
-                "categories": CategoryIndustrySerializer(category_list, many=True).data
-            })
-
-        paginator = CustomPagination()
-        paginated_result = paginator.paginate_queryset(grouped_data, request)
+                "categories": CategoryIndustrySerializer(industry.admin_categories, many=True).data
+            }
+            for industry in paginator.paginate_queryset(industries, request)
+        ]
 
         return paginator.get_paginated_response(paginated_result)
     
@@ -337,20 +344,18 @@ class IndustryViewSet(viewsets.ModelViewSet):
     def industries_used(self, request):
         """Get the total count and paginated list of industries an employer has posted jobs under."""
         employer = request.user
-        cache_key = f"industries_used_{employer.id}"
-        cached_data = cache.get(cache_key)
-
-        if cached_data:
-            return Response(cached_data)
+        cache_key = make_cache_key(
+            "iu:", employer.id, request.query_params.get("page") or "1", request.query_params.get("page_size") or ""
+        )
 
-        industries = Industry.objects.filter(jobs__posted_by=employer).distinct()
-        paginator = CustomPagination()
-        paginated_industries = paginator.paginate_queryset(industries, request)
-        serialized_data = IndustrySerializer(paginated_industries, many=True).data
-        response =  paginator.get_paginated_response(serialized_data)
-        cache.set(cache_key, response.data, timeout=120)
+        def build_payload():
+            industries = Industry.objects.filter(jobs__posted_by=employer).distinct()
+            paginator = self.paginator
+            paginated_industries = paginator.paginate_queryset(industries, request)
+            serialized_data = IndustrySerializer(paginated_industries, many=True).data
+            return paginator.get_paginated_response(serialized_data).data
 
-        return response
+        return Response(get_or_set_with_stale(cache_key, build_payload))
 
 class CategoryViewSet(viewsets.ModelViewSet):
     """API for creating and modifying categories"""
@@ -377,8 +382,8 @@ class CategoryViewSet(viewsets.ModelViewSet):
         operation_description="API that allows only admins create new category.",
         request_body=CategorySerializer,
         responses={
-            201: openapi.Response("Created submitted successfully.", schema=openapi.Schema(type=openapi.TYPE_OBJECT, properties={"message": openapi.Schema(type=openapi.TYPE_STRING)})),
-            400: openapi.Response("Validation error (e.g., already created).", schema=openapi.Schema(type=openapi.TYPE_OBJECT, properties={"error": openapi.Schema(type=openapi.TYPE_STRING)})),
+            201: MESSAGE_RESPONSE,
+            400: ERROR_RESPONSE,
         }
     )
     def create(self, request, *args, **kwargs):
@@ -431,47 +436,27 @@ class CategoryViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"], url_path="jobs")
     def get_category_jobs(self, request, pk=None):
         """Retrieve all jobs under a specific industry category."""
-        try:
-            category = self.get_object()
-            jobs = Job.objects.filter(category=category).select_related("category").order_by('-posted_at')
-
-            paginator = CustomPagination()
-            paginated_jobs = paginator.paginate_queryset(jobs, request, view=self)
-            serializer = JobSerializer(paginated_jobs, many=True)
+        category = self.get_object()
+        jobs = Job.objects.filter(category=category).select_related("category").order_by('-posted_at')
 
-            return paginator.get_paginated_response(serializer.data)
+        paginator = self.paginator
+        paginated_jobs = paginator.paginate_queryset(jobs, request, view=self)
+        serializer = JobSerializer(paginated_jobs, many=True)
 
-        except Exception as e:
-            logger.error(f"Unexpected error in get_category_jobs: {str(e)}\n{traceback.format_exc()}")
-            return Response({"error": "An unexpected error occurred."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        return paginator.get_paginated_response(serializer.data)
 
 class JobViewSet(viewsets.ModelViewSet):
     """API endpoint for jobs with optimized categorized-jobs endpoint."""
-    queryset = Job.objects.select_related("industry", "posted_by").only(
-        "id", "title", "industry__name", "description", "location", "type", "posted_by__id"
-    ).order_by("-posted_at")
+    queryset = Job.objects.select_related("industry", "category", "posted_by").defer("search_vector").order_by("-posted_at")
     
     serializer_class = JobSerializer
     pagination_class = CustomPagination
-    filter_backends = [filters.SearchFilter]
+    filter_backends = [SearchVectorFilter]
     permission_classes = [ReadOnlyModifyByAdminEmployer]
-    search_fields = ["title", "type", "location", "industry__name"]
 
     def perform_create(self, serializer):
-        """Assign the authenticated user as the poster and clear cache."""
+        """Assign the authenticated user as the poster; jobs.signals clears the cached listings."""
         serializer.save(posted_by=self.request.user)
-        self.clear_cache()
-
-    def perform_update(self, serializer):
-        """Update a job and clear related caches."""
-        instance = serializer.save()
-        self.clear_cache()
-        cache.delete(f"job_{instance.id}")
-
-    def perform_destroy(self, instance):
-        """Delete a job and clear related caches."""
-        self.clear_cache()
-        instance.delete()
 
     @swagger_auto_schema(
         operation_summary="List Jobs",
@@ -485,66 +470,38 @@ class JobViewSet(viewsets.ModelViewSet):
         responses={200: JobSerializer(many=True)}
     )
     def list(self, request, *args, **kwargs):
-        """Fetch job listings, ensure absolute picture URLs, and apply caching."""
-
-        cache_key = f"job_list_{request.query_params.get('search', '')}_{request.query_params.get('page', '')}_{request.query_params.get('page_size', '')}"
-        cached_data = cache.get(cache_key)
-
-        if cached_data:
-            return Response(cached_data)
-
-        def get_absolute_picture_url(picture_url):
-            """Return absolute URL for job picture based on environment."""
-            if not picture_url:
-                return None
-
-            if settings.DEBUG:
-                return request.build_absolute_uri(picture_url) if request else picture_url
-            else:
-                if not picture_url.startswith("http"):
-                    cloud_name = getattr(settings, "CLOUDINARY_CLOUD_NAME", "temz-cloudinary")
-                    return f"https://res.cloudinary.com/{cloud_name}/{picture_url}"
-                return picture_url
+        """Fetch job listings and apply caching."""
+
+        params = request.query_params
+        cache_key = make_cache_key(
+            JOB_LIST_CACHE_PREFIX,
+            params.get("search") or "",
+            params.get("page") or "1",
+            params.get("page_size") or str(CustomPagination.page_size),
+        )
 
-        queryset = self.filter_queryset(self.get_queryset())
-        page = self.paginate_queryset(queryset)
+        def build_payload():
+            queryset = self.filter_queryset(self.get_queryset())
+            page = self.paginate_queryset(queryset)
 
-        if page is not None:
-            serializer = JobListSerializer(page, many=True, context={"request": request})
-            response = self.get_paginated_response(serializer.data)
-        else:
-            serializer = JobListSerializer(queryset, many=True, context={"request": request})
-            response = Response(serializer.data)
+            if page is not None:
+                serializer = JobListSerializer(page, many=True, context={"request": request})
+                return self.get_paginated_response(serializer.data).data
+            return JobListSerializer(queryset, many=True, context={"request": request}).data
 
-        for job in response.data["results"]:
-            if "picture" in job:
-                job["picture"] = get_absolute_picture_url(job["picture"]) 
-    
-        cache.set(cache_key, response.data, timeout=120) 
-        return response
-    
-    def clear_cache(self):
-        """Clear all job-related cache keys."""
-        cache.delete_pattern("job_list_*")
+        return Response(get_or_set_with_stale(cache_key, build_payload))
     
     @swagger_auto_schema(
         operation_summary="Create new Job",
         operation_description="API that allows only admins and employer create new job.",
         request_body=JobSerializer,
         responses={
-            201: openapi.Response("Created submitted successfully.", schema=openapi.Schema(type=openapi.TYPE_OBJECT, properties={"message": openapi.Schema(type=openapi.TYPE_STRING)})),
-            400: openapi.Response("Validation error (e.g., already created).", schema=openapi.Schema(type=openapi.TYPE_OBJECT, properties={"error": openapi.Schema(type=openapi.TYPE_STRING)})),
+            201: MESSAGE_RESPONSE,
+            400: ERROR_RESPONSE,
         }
     )
     def create(self, request, *args, **kwargs):
-        try:
-            return super().create(request, *args, **kwargs)
-        except ValidationError as e:
-            return Response(e.message_dict, status=status.HTTP_400_BAD_REQUEST)
-        except serializers.ValidationError as e:
-            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        return super().create(request, *args, **kwargs)
 
     @swagger_auto_schema(
         operation_summary="Retrieve a job",
@@ -552,35 +509,13 @@ class JobViewSet(viewsets.ModelViewSet):
         responses={200: JobSerializer}
     )
     def retrieve(self, request, *args, **kwargs):
-        """Fetch individual job details, ensure absolute picture URL, and apply caching."""
+        """Fetch individual job details and apply caching."""
 
         job_id = kwargs.get("pk")
-        cache_key = f"job_{job_id}"
-        cached_data = cache.get(cache_key)
-
-        if cached_data:
-            return Response(cached_data)
-
-        def get_absolute_picture_url(picture_url):
-            """Return absolute URL for job picture based on environment."""
-            if not picture_url:
-                return None
-
-            if settings.DEBUG:
-                return request.build_absolute_uri(picture_url) if request else picture_url
-            else:
-                if not picture_url.startswith("http"):
-                    cloud_name = getattr(settings, "CLOUDINARY_CLOUD_NAME", "temz-cloudinary")
-                    return f"https://res.cloudinary.com/{cloud_name}/{picture_url}"
-                return picture_url
-
-        response = super().retrieve(request, *args, **kwargs)
-        job_data = response.data
-
-        if "picture" in job_data:
-            job_data["picture"] = get_absolute_picture_url(job_data["picture"])
-
-        cache.set(cache_key, job_data, timeout=120)
+        parent_retrieve = super().retrieve
+        job_data = get_or_set_with_stale(
+            job_detail_cache_key(job_id), lambda: parent_retrieve(request, *args, **kwargs).data
+        )
         return Response(job_data)
 
     
@@ -610,21 +545,79 @@ class JobViewSet(viewsets.ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         return super().destroy(request, *args, **kwargs)
     
-    def _paginate_queryset(self, request, job_list, category):
-        """Helper method to paginate job listings"""
-        page_size = int(request.GET.get("page_size", 10))
-        page_number = int(request.GET.get("page", 1))
-        paginator = Paginator(job_list, page_size)
-        page = paginator.get_page(page_number)
-
+    def _page_params(self, request):
+        """Return the requested (page_number, page_size), falling back to defaults on bad input."""
+        try:
+            page_size = min(max(int(request.GET.get("page_size", 10)), 1), CustomPagination.max_page_size)
+            page_number = max(int(request.GET.get("page", 1)), 1)
+        except ValueError:
+            page_size, page_number = 10, 1
+        return page_number, page_size
+
+    def _page_payload(self, rows, total_count, page_number, has_next):
+        """Shape one page of a job group the way categorized-jobs responses expect."""
         return {
-            "total_count": paginator.count,
-            "jobs": list(page),
+            "total_count": total_count,
+            "jobs": rows,
             "pagination": {
-                "next": page.next_page_number() if page.has_next() else None,
-                "previous": page.previous_page_number() if page.has_previous() else None,
+                "next": page_number + 1 if has_next else None,
+                "previous": page_number - 1 if page_number > 1 else None,
             },
         }
+
+    def _paginate_queryset(self, request, job_list, count_key):
+        """Helper method to paginate job listings.
+
+        Fetches one row past the page to detect a next page. The COUNT(*) is cached
+        under `count_key` and only recomputed on the first page or on a miss, so
+        later pages still report the total without counting again.
+        """
+        page_number, page_size = self._page_params(request)
+        offset = (page_number - 1) * page_size
+        rows = list(job_list[offset:offset + page_size + 1])
+        if page_number == 1:
+            total_count = job_list.count()
+            cache.set(count_key, total_count, CATEGORIZED_JOBS_COUNT_TIMEOUT)
+        else:
+            total_count = cache.get_or_set(count_key, job_list.count, CATEGORIZED_JOBS_COUNT_TIMEOUT)
+        return self._page_payload(rows[:page_size], total_count, page_number, len(rows) > page_size)
+
+    def _categorized_job_rows(self, queryset):
+        """Project jobs to the row shape returned by the categorized-jobs endpoint."""
+        # A correlated subquery avoids grouping the outer query by every selected (wide) column.
+        applicant_count = (
+            Application.objects.filter(job=OuterRef("pk"))
+            .order_by()
+            .values("job")
+            .annotate(count=Count("*"))
+            .values("count")
+        )
+        return queryset.annotate(
+            industry_name=F("industry__name"),
+            category_name=F("category__name"),
+            no_of_applicants=Coalesce(Subquery(applicant_count, output_field=IntegerField()), 0),
+        ).values(
+            "id", "title", "industry_name", "category_name",
+            "location", "required_skills", "type", "wage",
+            "description", "no_of_applicants", "is_active"
+        ).order_by("-posted_at")
+
+    def _group_expression(self, category):
+        """SQL expression for the group a job falls under; blank values are grouped as "Other"."""
+        if category == "industry":
+            return Coalesce(F("industry__name"), Value("Other"))
+        return Coalesce(NullIf(F("location"), Value("")), Value("Other"))
+
+    def _group_condition(self, category, key):
+        """Filter matching the jobs that belong to the group named `key`."""
+        if category == "type":
+            return Q(type__contains=[key])
+
+        lookup = "industry__name" if category == "industry" else "location"
+        condition = Q(**{lookup: key})
+        if key == "Other":
+            condition |= Q(**{f"{lookup}__isnull": True}) | Q(**{lookup: ""})
+        return condition
     
     @swagger_auto_schema(
     method='get',
@@ -679,34 +672,75 @@ class JobViewSet(viewsets.ModelViewSet):
         if category not in ["location", "type", "industry"]:
             return Response({"error": "Invalid category. Use location, type, or industry."}, status=status.HTTP_400_BAD_REQUEST)
 
-        jobs = Job.objects.annotate(industry_name=F("industry__name"), category_name=F("category__name"), no_of_applicants=Count("applications"))
-        if search_query:
-            jobs = jobs.filter(
-                Q(title__icontains=search_query) |
-                Q(industry__name__icontains=search_query) |
-                Q(location__icontains=search_query) |
-                Q(type__icontains=[search_query])
-            )
+        cache_key = make_cache_key(
+            CATEGORIZED_JOBS_CACHE_PREFIX,
+            category,
+            category_filter or "",
+            search_query,
+            request.GET.get("page") or "1",
+            request.GET.get("page_size") or "10",
+        )
+
+        def build_payload():
+            matching = Job.objects.all()
+            if search_query:
+                matching = matching.filter(
+                    Q(title__icontains=search_query) |
+                    Q(industry__name__icontains=search_query) |
+                    Q(location__icontains=search_query) |
+                    Q(type__contains=[search_query.lower()])
+                )
+
+            if category_filter:
+                jobs = self._categorized_job_rows(matching.filter(self._group_condition(category, category_filter)))
+                # Shares the categorized prefix so job changes clear the count with the pages.
+                count_key = make_cache_key(
+                    CATEGORIZED_JOBS_CACHE_PREFIX, "count", category, category_filter, search_query
+                )
+                return {category_filter: self._paginate_queryset(request, jobs, count_key)}
+
+            page_number, page_size = self._page_params(request)
+            offset = (page_number - 1) * page_size
+            pages = defaultdict(list)
 
-        category_field = "industry_name" if category == "industry" else category
-        jobs = jobs.values(
-            "id", "title", "industry_name", "category_name",
-            "location", "required_skills", "type", "wage",
-            "description", "no_of_applicants", "is_active"
-            ).order_by("-posted_at")
-        job_groups = defaultdict(list)
-        for job in jobs:
             if category == "type":
-                for job_type in job["type"]:
-                    job_groups[job_type].append(job)
+                # Job.clean limits types to JOB_TYPE_CHOICES, so the groups are known up front.
+                counts = matching.aggregate(**{
+                    f"total_{index}": Count("id", filter=Q(type__contains=[job_type]))
+                    for index, job_type in enumerate(Job.JOB_TYPE_CHOICES)
+                })
+                totals = {job_type: counts[f"total_{index}"] for index, job_type in enumerate(Job.JOB_TYPE_CHOICES)}
+                for job_type, total in totals.items():
+                    if total > offset:
+                        jobs = self._categorized_job_rows(matching.filter(type__contains=[job_type]))
+                        pages[job_type] = list(jobs[offset:offset + page_size])
             else:
-                job_groups[job[category_field] or "Other"].append(job)
+                group_key = self._group_expression(category)
+                totals = dict(
+                    matching.annotate(group_key=group_key)
+                    .values("group_key")
+                    .annotate(total=Count("id"))
+                    .order_by("group_key")
+                    .values_list("group_key", "total")
+                )
+                # Number jobs within each group in SQL and keep only this page's slice of every group.
+                page_groups = dict(
+                    matching.annotate(
+                        group_key=group_key,
+                        row_number=Window(RowNumber(), partition_by=[group_key], order_by=F("posted_at").desc()),
+                    )
+                    .filter(row_number__gt=offset, row_number__lte=offset + page_size)
+                    .values_list("id", "group_key")
+                )
+                for job in self._categorized_job_rows(Job.objects.filter(id__in=page_groups)):
+                    pages[page_groups[job["id"]]].append(job)
 
-        if category_filter:
-            job_groups = {category_filter: job_groups.get(category_filter, [])}
+            return {
+                key: self._page_payload(pages[key], total, page_number, offset + page_size < total)
+                for key, total in totals.items() if total
+            }
 
-        paginated_data = {key: self._paginate_queryset(request, job_list, category) for key, job_list in job_groups.items()}
-        return Response(paginated_data, status=status.HTTP_200_OK)
+        return Response(get_or_set_with_stale(cache_key, build_payload, timeout=300), status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
         method='get',
@@ -722,14 +756,33 @@ class JobViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"], url_path="applicants")
     def get_applicants(self, request, pk=None):
         """Optimized applicants retrieval with caching."""
-        job = self.get_object()
-        if not request.user.is_authenticated or (not request.user.is_superuser and job.posted_by != request.user):
-            return Response(
-                {"detail": "You do not have permission to perform this action."}, 
-                status=status.HTTP_403_FORBIDDEN
+        user = request.user
+        forbidden = Response(
+            {"detail": "You do not have permission to perform this action."},
+            status=status.HTTP_403_FORBIDDEN
+        )
+        if not user.is_authenticated:
+            return forbidden
+
+        jobs = Job.objects.defer("search_vector")
+        if user.is_superuser:
+            job = get_object_or_404(jobs, pk=pk)
+        else:
+            # Ownership is part of the lookup, so a denied request costs one indexed query.
+            job = jobs.filter(pk=pk, posted_by_id=user.id).first()
+            if job is None:
+                return forbidden
+        applicants = (
+            Application.objects.filter(job=job)
+            .select_related("applicant")
+            .only(
+                "id", "job", "resume_link", "cover_letter", "status", "applied_at",
+                "applicant", "applicant__id", "applicant__first_name", "applicant__last_name",
+                "applicant__email", "applicant__phone",
             )
-        applicants = Application.objects.filter(job=job).select_related("applicant")
-        paginator = CustomPagination()
+            .order_by("-applied_at")
+        )
+        paginator = self.paginator
         paginated_applicants = paginator.paginate_queryset(applicants, request)
         job_data = AppJobSerializer(job).data
         serializer = ApplicationSerializer(paginated_applicants, many=True)
@@ -787,13 +840,18 @@ class JobViewSet(viewsets.ModelViewSet):
     def locations(self, request):
         """Get paginated distinct job locations"""
         search_query = request.GET.get("search", "").strip()
-        def generate_locations():
-            for location in Job.objects.exclude(location="").values_list("location", flat=True).distinct():
-                if not search_query or search_query.lower() in location.lower():
-                    yield location
+        locations = Job.objects.exclude(location="")
+        if search_query:
+            locations = locations.filter(location__icontains=search_query)
+        locations = (
+            locations.values("location")
+            .annotate(jobs_count=Count("id"))
+            .order_by("location")
+            .values_list("location", flat=True)
+        )
 
-        paginator = CustomPagination()
-        result_page = paginator.paginate_queryset(list(generate_locations()), request)
+        paginator = self.paginator
+        result_page = paginator.paginate_queryset(locations, request)
         return paginator.get_paginated_response(result_page)
         
     @swagger_auto_schema(
@@ -809,9 +867,8 @@ class JobViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"], url_path="total-jobs", permission_classes=[IsAdminAndEmployer])
     def total_jobs(self, request):
         """Returns the total number of jobs posted by the signed-in employer/admin"""
-        user = request.user
-        total_jobs = Job.objects.filter(posted_by=user).count()
-        return Response({"total_jobs": total_jobs})
+        stats = EmployerStats.for_user(request.user.id)
+        return Response({"total_jobs": stats.jobs_count})
     
     @swagger_auto_schema(
         operation_summary="List all jobs posted by signed-in employer/admin",
@@ -827,12 +884,10 @@ class JobViewSet(viewsets.ModelViewSet):
     def list_total_jobs(self, request):
         """Returns the list of total number of jobs posted by the signed-in employer/admin"""
         user = request.user
-        def generate_jobs():
-            for job in Job.objects.filter(posted_by=user):
-                yield job
+        jobs = Job.objects.filter(posted_by=user).select_related("industry", "category", "posted_by").defer("search_vector").order_by("-posted_at")
 
-        paginator = CustomPagination()
-        result_page = paginator.paginate_queryset(list(generate_jobs()), request)
+        paginator = self.paginator
+        result_page = paginator.paginate_queryset(jobs, request)
         serializer = JobListSerializer(result_page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -849,13 +904,8 @@ class JobViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"], url_path="total-applicants", permission_classes=[IsAdminAndEmployer])
     def total_applicants(self, request):
         """Returns the total number of applicants for all jobs posted by the signed-in employer."""
-        user = request.user
-        
-        all_employer_jobs = Job.objects.filter(posted_by=user)
-        
-        total_applicants = Application.objects.filter(job__in=all_employer_jobs).count()
-        
-        return Response({"all_applicants": total_applicants})
+        stats = EmployerStats.for_user(request.user.id)
+        return Response({"all_applicants": stats.applicants_count})
         
     @swagger_auto_schema(
         method="get",
@@ -906,22 +956,41 @@ class JobViewSet(viewsets.ModelViewSet):
     )
     @action(detail=False, methods=["get"], url_path="list-total-applicants", permission_classes=[IsAdminAndEmployer])
     def list_total_applicants(self, request):
-        """Returns categorized applications for jobs posted by the signed-in employer, using yield for better memory efficiency."""
+        """Returns categorized applications for jobs posted by the signed-in employer."""
         user = request.user
 
-        def generate_categorized_applications():
-            for job in Job.objects.filter(posted_by=user):
-                job_applications = Application.objects.filter(job=job)
-                if job_applications.exists():
-                    yield {
-                        "job_id": job.id,
-                        "job_title": job.title,
-                        "no_of_applicants": job_applications.count(),
-                        "applications": ApplicationSerializer(job_applications, many=True).data
-                    }
+        jobs = (
+            Job.objects.filter(posted_by=user)
+            .only("id", "title", "posted_at")
+            .annotate(no_of_applicants=Count("applications"))
+            .filter(no_of_applicants__gt=0)
+            .prefetch_related(
+                Prefetch(
+                    "applications",
+                    queryset=Application.objects.select_related("applicant"),
+                    to_attr="prefetched_applications",
+                )
+            )
+            .order_by("-posted_at")
+        )
+
+        paginator = self.paginator
+        page = paginator.paginate_queryset(jobs, request)
 
-        paginator = CustomPagination()
-        paginated_result = paginator.paginate_queryset(list(generate_categorized_applications()), request)
+        applications_by_job = defaultdict(list)
+        page_applications = [application for job in page for application in job.prefetched_applications]
+        for row in ApplicationSerializer(page_applications, many=True).data:
+            applications_by_job[row["job"]].append(row)
+
+        paginated_result = [
+            {
+                "job_id": job.id,
+                "job_title": job.title,
+                "no_of_applicants": job.no_of_applicants,
+                "applications": applications_by_job[job.id]
+            }
+            for job in page
+        ]
 
         response_data = {
             "total_applications": sum(job["no_of_applicants"] for job in paginated_result),
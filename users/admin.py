@@ -18,16 +18,21 @@ class UserAdmin(admin.ModelAdmin):
                 obj.set_password(form.cleaned_data["password"])
 
         super().save_model(request, obj, form, change)
+        if not change:
+            obj.create_profile()
 
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
     list_display = ('user','location', 'experience_level')
     list_filter = ('location', 'experience_level')
-    search_fields = ('email',)
+    search_fields = ('user__email',)
+    autocomplete_fields = ('user',)
+    list_select_related = ('user',)
 
 @admin.register(EmployerProfile)
 class EmployerProfileAdmin(admin.ModelAdmin):
     list_display = ('user','company_location')
-    list_filter = ('user',)
-    search_fields = ('email',)
+    search_fields = ('user__email',)
+    autocomplete_fields = ('user',)
+    list_select_related = ('user',)
 
@@ -9,11 +9,68 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from users.permissions import CanCreateUserOrEmployer
 from django.shortcuts import get_object_or_404
-from .models import User, EmployerProfile
+from .models import User
 from .serializers import UserSerializer
 from rest_framework import generics
 from rest_framework.views import APIView
-from .tasks.email_tasks import send_welcome_email, send_employer_welcome_email
+from .tasks.user_tasks import update_last_login
+
+# Login responses expose the claims under the model's field names.
+_LOGIN_USER_DATA_FIELDS = {
+    "email": "email",
+    "first_name": "firstname",
+    "last_name": "lastname",
+    "is_staff": "isStaff",
+    "is_superuser": "isSuperAdmin",
+    "is_active": "isActive",
+    "role": "role",
+    "phone": "phone",
+    "groups": "groups",
+    "permissions": "permissions",
+    "company_name": "company_name",
+    "industry": "industry",
+}
+
+
+def _build_user_claims(user, groups, permissions):
+    """Build the custom JWT claims shared by the login and refresh views."""
+    claims = {
+        "email": user.email,
+        "firstname": user.first_name,
+        "lastname": user.last_name,
+        "isStaff": user.is_staff,
+        "isSuperAdmin": user.is_superuser,
+        "isActive": user.is_active,
+        "role": user.role,
+        "phone": user.phone,
+        "groups": groups,
+        "permissions": permissions,
+    }
+    if user.role == "employer":
+        claims["company_name"] = user.company_name
+        claims["industry"] = user.industry
+    return claims
+
+
+def _set_token_claims(token, claims):
+    for claim, value in claims.items():
+        token[claim] = value
+
+
+TOKEN_USER_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        'id': openapi.Schema(type=openapi.TYPE_INTEGER, description="User ID"),
+        'username': openapi.Schema(type=openapi.TYPE_STRING, description="Username"),
+        'email': openapi.Schema(type=openapi.TYPE_STRING, description="User email"),
+        'first_name': openapi.Schema(type=openapi.TYPE_STRING, description="User first_name"),
+        'last_name': openapi.Schema(type=openapi.TYPE_STRING, description="User last_name"),
+        'is_staff': openapi.Schema(type=openapi.TYPE_BOOLEAN, description="is_staff"),
+        'is_active': openapi.Schema(type=openapi.TYPE_BOOLEAN, description="is_active"),
+        'phone': openapi.Schema(type=openapi.TYPE_STRING, description="User phone"),
+    }
+)
+
 
 class CustomTokenObtainPairView(TokenObtainPairView):
     """Login to user account and return access and refresh tokens"""
@@ -28,19 +85,7 @@ class CustomTokenObtainPairView(TokenObtainPairView):
                 properties={
                     'access_token': openapi.Schema(type=openapi.TYPE_STRING, description="JWT access token"),
                     'refresh_token': openapi.Schema(type=openapi.TYPE_STRING, description="JWT refresh token"),
-                    'user': openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        'id': openapi.Schema(type=openapi.TYPE_INTEGER, description="User ID"),
-                        'username': openapi.Schema(type=openapi.TYPE_STRING, description="Username"),
-                        'email': openapi.Schema(type=openapi.TYPE_STRING, description="User email"),
-                        'first_name': openapi.Schema(type=openapi.TYPE_STRING, description="User first_name"),
-                        'last_name': openapi.Schema(type=openapi.TYPE_STRING, description="User last_name"),
-                        'is_staff': openapi.Schema(type=openapi.TYPE_BOOLEAN, description="is_staff"),
-                        'is_active': openapi.Schema(type=openapi.TYPE_BOOLEAN, description="is_active"),
-                        'phone': openapi.Schema(type=openapi.TYPE_STRING, description="User phone"),
-                    }
-                )
+                    'user': TOKEN_USER_SCHEMA,
                 }
             ),
             400: openapi.Response("Bad request"),
@@ -48,45 +93,16 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     )
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
-        if serializer.is_valid(raise_exception=True):
-            user = serializer.validated_data['user']
-            user.last_login = now()
-            user.save(update_fields=['last_login'])
-            
-            refresh = RefreshToken.for_user(user)
-            refresh["email"] = user.email
-            refresh["firstname"] = user.first_name
-            refresh["lastname"] = user.last_name
-            refresh["isStaff"] = user.is_staff
-            refresh["isSuperAdmin"] = user.is_superuser
-            refresh["isActive"] = user.is_active
-            refresh["role"] = user.role
-            refresh["phone"] = user.phone
-            refresh["groups"] = list(user.groups.values_list("name", flat=True))
-            refresh["permissions"] = list(user.user_permissions.values_list("codename", flat=True))
-            if user.role == "employer":
-                refresh["company_name"] = user.company_name
-                refresh["industry"] = user.industry
+        serializer.is_valid(raise_exception=True)
+        user = serializer.validated_data['user']
+        update_last_login.delay(user.id, now().isoformat())
 
-            user_data = {
-            "id": user.id,
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "is_staff": user.is_staff,
-            "is_superuser": user.is_superuser,
-            "is_active": user.is_active,
-            "role": user.role,
-            "phone": user.phone,
-            "groups": list(user.groups.values_list("name", flat=True)),
-            "permissions": list(user.user_permissions.values_list("codename", flat=True))
-        }
+        claims = _build_user_claims(user, user.group_names or [], user.permission_codenames or [])
+        refresh = RefreshToken.for_user(user)
+        _set_token_claims(refresh, claims)
 
-        if user.role == "employer":
-            refresh["company_name"] = user.company_name
-            refresh["industry"] = user.industry
-            user_data["company_name"] = user.company_name
-            user_data["industry"] = user.industry
+        user_data = {"id": user.id}
+        user_data.update((field, claims[claim]) for field, claim in _LOGIN_USER_DATA_FIELDS.items() if claim in claims)
 
         return Response(
             {
@@ -97,10 +113,6 @@ class CustomTokenObtainPairView(TokenObtainPairView):
             status=status.HTTP_200_OK,
         )
 
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
-
-
 
 class CustomTokenRefreshView(TokenRefreshView):
     """Generate new access token using refresh token"""
@@ -121,19 +133,7 @@ class CustomTokenRefreshView(TokenRefreshView):
                 properties={
                     "access_token": openapi.Schema(type=openapi.TYPE_STRING, description="New JWT access token"),
                     "refresh_token": openapi.Schema(type=openapi.TYPE_STRING, description="New refresh token"),
-                    'user': openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        'id': openapi.Schema(type=openapi.TYPE_INTEGER, description="User ID"),
-                        'username': openapi.Schema(type=openapi.TYPE_STRING, description="Username"),
-                        'email': openapi.Schema(type=openapi.TYPE_STRING, description="User email"),
-                        'first_name': openapi.Schema(type=openapi.TYPE_STRING, description="User first_name"),
-                        'last_name': openapi.Schema(type=openapi.TYPE_STRING, description="User last_name"),
-                        'is_staff': openapi.Schema(type=openapi.TYPE_BOOLEAN, description="is_staff"),
-                        'is_active': openapi.Schema(type=openapi.TYPE_BOOLEAN, description="is_active"),
-                        'phone': openapi.Schema(type=openapi.TYPE_STRING, description="User phone"),
-                    }
-                    )
+                    'user': TOKEN_USER_SCHEMA,
                 }
             ),
             400: openapi.Response("Bad request"),
@@ -151,38 +151,12 @@ class CustomTokenRefreshView(TokenRefreshView):
             user_id = refresh["user_id"]
 
             user = get_object_or_404(User, id=user_id)
+            groups, permissions = User.objects.get_access_names(user.id)
 
+            claims = _build_user_claims(user, groups, permissions)
             new_refresh_token = RefreshToken.for_user(user)
-
-            fields_to_preserve = [
-                "email", "firstname", "lastname", "isStaff", "isSuperAdmin", 
-                "isActive", "role", "groups", "permissions", "address", "phone",
-                "token_type"
-            ]
-
-            for field in fields_to_preserve:
-                if field in refresh:
-                    new_refresh_token[field] = refresh[field]
-
-            user_data = {
-                "id": user.id,
-                "email": user.email,
-                "firstname": user.first_name,
-                "lastname": user.last_name,
-                "isStaff": user.is_staff,
-                "isSuperAdmin": user.is_superuser,
-                "isActive": user.is_active,
-                "role": user.role,
-                "phone": user.phone,
-                "groups": list(user.groups.values_list("name", flat=True)),
-                "permissions": list(user.user_permissions.values_list("codename", flat=True)),
-            }
-
-            if user.role == "employer":
-                new_refresh_token["company_name"] = user.company_name
-                new_refresh_token["industry"] = user.industry
-                user_data["company_name"] = user.company_name
-                user_data["industry"] = user.industry
+            _set_token_claims(new_refresh_token, claims)
+            user_data = {"id": user.id, **claims}
 
             return Response({
                 "access_token": str(new_refresh_token.access_token),
@@ -203,19 +177,9 @@ class UserCreateView(generics.CreateAPIView):
     permission_classes = [CanCreateUserOrEmployer]
     
     def perform_create(self, serializer):
-        user = serializer.save(is_active=True)
-        if user.role == 'admin':
-            user.is_staff = True
-            user.is_superuser = True
-            user.save(update_fields=["is_staff", "is_superuser"])
-
-        elif user.role == 'user':
-            send_welcome_email.delay(user.email, user.first_name)
-
-        elif user.role == 'employer':
-            employer_profile = EmployerProfile.objects.filter(user=user).first()
-            if employer_profile:
-                send_employer_welcome_email.delay(user.email, user.company_name)
+        # Admin flags go into the INSERT itself rather than a follow-up UPDATE; the welcome email is sent by a signal.
+        admin_flags = {"is_staff": True, "is_superuser": True} if serializer.validated_data.get("role") == "admin" else {}
+        serializer.save(is_active=True, **admin_flags)
     
     @swagger_auto_schema(
         operation_summary="Sign up new account. (Public access signup)",
@@ -0,0 +1,29 @@
+import hashlib
+import threading
+import time
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+# Validated access tokens keyed by a digest of the raw token, so repeat requests skip signature checks.
+TOKEN_CACHE_TTL = 30
+TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache = {}
+_token_cache_lock = threading.Lock()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWT authentication that reuses a token's validation result for a short TTL, never past its expiry."""
+
+    def get_validated_token(self, raw_token):
+        key = hashlib.blake2b(raw_token, digest_size=16).digest()
+        current_time = time.time()
+        cached = _token_cache.get(key)
+        if cached and cached[1] > current_time:
+            return cached[0]
+
+        token = super().get_validated_token(raw_token)
+        expires_at = min(current_time + TOKEN_CACHE_TTL, token["exp"])
+        with _token_cache_lock:
+            if len(_token_cache) >= TOKEN_CACHE_MAXSIZE:
+                _token_cache.pop(next(iter(_token_cache)))
+            _token_cache[key] = (token, expires_at)
+        return token
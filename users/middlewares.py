@@ -1,13 +1,11 @@
 import logging
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
 from django.http import JsonResponse
-import json
 import time
-from datetime import datetime
-from rest_framework_simplejwt.authentication import JWTAuthentication
-from django.utils.deprecation import MiddlewareMixin
-
-
-logger = logging.getLogger(__name__)
+from users.authentication import CachedJWTAuthentication
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from job_board_platform.logging_handlers import enqueue_request_log, encode_request_log
 
 
 logger = logging.getLogger(__name__)
@@ -15,50 +13,79 @@ logger = logging.getLogger(__name__)
 class ExceptionMiddleware:
     """Middleware to handle all unexpected errors globally"""
     def __init__(self, get_response):
+        # Keep Django's debug error pages in development.
+        if settings.DEBUG:
+            raise MiddlewareNotUsed
         self.get_response = get_response
 
     def __call__(self, request):
-        try:
-            response = self.get_response(request)
-            return response
-        except Exception as e:
-            logger.error(f"Unhandled server error: {e}", exc_info=True)
-            return JsonResponse({"error": "An internal server error occurred."}, status=500)
-    
+        return self.get_response(request)
+
     def process_exception(self, request, exception):
         """This method is explicitly called for unhandled exceptions."""
-        logger.error(f"Exception caught in middleware: {exception}", exc_info=True)
+        logger.error("Exception caught in middleware: %s", exception, exc_info=exception)
         return JsonResponse({"error": "An internal server error occurred."}, status=500)
 
-class RequestLoggingMiddleware(MiddlewareMixin):
-    """Middleware to log requests and responses with additional details."""
+class RequestLoggingMiddleware:
+    """Middleware to log requests and responses with additional details; runs natively under WSGI and ASGI."""
+    sync_capable = True
+    async_capable = True
 
     def __init__(self, get_response):
         self.get_response = get_response
-        self.jwt_authenticator = JWTAuthentication()
+        self.jwt_authenticator = CachedJWTAuthentication()
+        self.log_to_console = logger.isEnabledFor(logging.INFO)
+        self.log_to_file = settings.REQUEST_LOG_FILE_ENABLED
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
 
     def __call__(self, request):
-        start_time = time.time()
-        
-        # Attempt JWT authentication first
-        email = "Anonymous"
-        role = "visitor"
-        
-        try:
-            auth_result = self.jwt_authenticator.authenticate(request)
-            if auth_result:
-                email = auth_result[0].email  # Extract email
-                role = getattr(auth_result[0], "role", "unknown")
-            else:
-                # If JWT auth fails, check session authentication (useful for Django Admin)
-                if request.user.is_authenticated:
-                    email = request.user.email
-                    role = getattr(request.user, "role", "admin")
+        if self.is_async:
+            return self.__acall__(request)
+        if not (self.log_to_console or self.log_to_file):
+            return self.get_response(request)
+
+        start_ns = time.time_ns()
+        identity = self.get_token_identity_or_none(request)
+        if identity is None and request.user.is_authenticated:
+            # If JWT auth fails, check session authentication (useful for Django Admin)
+            identity = self.get_session_identity(request)
+
+        request_data = self.build_request_data(request, start_ns, identity)
+        response = self.get_response(request)
+        self.emit(request_data, start_ns, response)
+        return response
+
+    async def __acall__(self, request):
+        if not (self.log_to_console or self.log_to_file):
+            return await self.get_response(request)
 
+        start_ns = time.time_ns()
+        identity = self.get_token_identity_or_none(request)
+        # Only hop to a thread for the session lookup when a session cookie was actually sent.
+        if identity is None and settings.SESSION_COOKIE_NAME in request.COOKIES:
+            identity = await sync_to_async(self.get_session_identity)(request)
+
+        request_data = self.build_request_data(request, start_ns, identity)
+        response = await self.get_response(request)
+        self.emit(request_data, start_ns, response)
+        return response
+
+    def get_token_identity_or_none(self, request):
+        try:
+            return self.get_token_identity(request)
         except Exception as e:
-            logger.error(f"JWT Authentication failed: {e}")
+            logger.error("JWT Authentication failed: %s", e)
+            return None
+
+    def get_session_identity(self, request):
+        if request.user.is_authenticated:
+            return request.user.email, getattr(request.user, "role", "admin")
+        return None
 
-        ip_address = self.get_client_ip(request)
+    def build_request_data(self, request, start_ns, identity):
+        email, role = identity or ("Anonymous", "visitor")
 
         relevant_headers = {
             "User-Agent": request.headers.get("User-Agent", "Unknown"),
@@ -68,26 +95,38 @@ class RequestLoggingMiddleware(MiddlewareMixin):
             "Accept-Language": request.headers.get("Accept-Language", "Unknown"),
         }
 
-        request_data = {
-            "timestamp": datetime.now().isoformat(),
+        return {
+            "timestamp": start_ns,
             "email": email,
             "role": role,
             "method": request.method,
             "path": request.path,
-            "ip": ip_address,
+            "ip": self.get_client_ip(request),
             "headers": relevant_headers,
         }
 
-        logger.info(f"Request: {json.dumps(request_data, indent=2)}")
-        response = self.get_response(request)
+    def emit(self, request_data, start_ns, response):
         request_data["status_code"] = response.status_code
-        request_data["duration"] = round(time.time() - start_time, 4)
-        logger.info(f"Response: {json.dumps(request_data, indent=2)}")
-
-        with open("requests.log", "a") as log_file:
-            log_file.write(json.dumps(request_data) + "\n")
-
-        return response
+        request_data["duration"] = round((time.time_ns() - start_ns) / 1e9, 4)
+
+        if self.log_to_console:
+            logger.info("Request: %s", encode_request_log(dict(request_data)).decode())
+        if self.log_to_file:
+            enqueue_request_log(request_data)
+
+    def get_token_identity(self, request):
+        """Return the (email, role) claims of the JWT bearer; token validation is cached by CachedJWTAuthentication."""
+        header = self.jwt_authenticator.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.jwt_authenticator.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        # Login and refresh embed email and role in the token, so the user row is never loaded here.
+        token = self.jwt_authenticator.get_validated_token(raw_token)
+        return token.get("email", "Anonymous"), token.get("role", "unknown")
 
     def get_client_ip(self, request):
         """Extracts the client IP address from the request."""
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.16 on 2026-10-16 15:40
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+USER_SEARCH_VECTOR_SQL = """
+CREATE OR REPLACE FUNCTION users_user_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := to_tsvector('pg_catalog.simple',
+        coalesce(NEW.email, '') || ' ' ||
+        translate(coalesce(NEW.email, ''), '@.', '  ') || ' ' ||
+        coalesce(NEW.first_name, '') || ' ' ||
+        coalesce(NEW.last_name, '') || ' ' ||
+        coalesce(NEW.company_name, '') || ' ' ||
+        coalesce(NEW.role, '')
+    );
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER users_user_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF email, first_name, last_name, company_name, role ON users_user
+    FOR EACH ROW EXECUTE FUNCTION users_user_search_vector_update();
+
+UPDATE users_user SET email = email;
+"""
+
+DROP_USER_SEARCH_VECTOR_SQL = """
+DROP TRIGGER IF EXISTS users_user_search_vector_trigger ON users_user;
+DROP FUNCTION IF EXISTS users_user_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_role_active_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='user_search_vector_gin'),
+        ),
+        migrations.RunSQL(USER_SEARCH_VECTOR_SQL, DROP_USER_SEARCH_VECTOR_SQL),
+    ]
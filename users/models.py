@@ -1,7 +1,18 @@
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
-from django.db import models
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Q
 import uuid
 
+ACCESS_NAMES_CACHE_TIMEOUT = 600
+
+
+def access_names_cache_key(user_id):
+    return f"user:claims:{user_id}"
+
 class CustomUserManager(BaseUserManager):
     """Custom manager for User model where email is the unique identifier"""
 
@@ -14,9 +25,23 @@ class CustomUserManager(BaseUserManager):
         extra_fields.setdefault("is_active", True)
         user = self.model(email=email, **extra_fields)
         user.set_password(password)
-        user.save(using=self._db)
+        with transaction.atomic(using=self._db):
+            user.save(using=self._db)
+            user.create_profile()
         return user
 
+    def bulk_create_users(self, users):
+        """Insert users whose passwords are already set, plus their profiles, in three queries"""
+        with transaction.atomic(using=self._db):
+            users = self.bulk_create(users)
+            EmployerProfile.objects.bulk_create(
+                [EmployerProfile(user=user) for user in users if user.role == "employer"]
+            )
+            UserProfile.objects.bulk_create(
+                [UserProfile(user=user) for user in users if user.role != "employer"]
+            )
+        return users
+
     def create_superuser(self, email, password=None, **extra_fields):
         """Create and return a superuser with admin permissions"""
         extra_fields.setdefault("is_staff", True)
@@ -25,6 +50,24 @@ class CustomUserManager(BaseUserManager):
 
         return self.create_user(email, password, **extra_fields)
 
+    def with_access_names(self):
+        """Annotate users with their group names and permission codenames in the same query"""
+        return self.get_queryset().annotate(
+            group_names=ArrayAgg("groups__name", distinct=True, filter=Q(groups__isnull=False)),
+            permission_codenames=ArrayAgg(
+                "user_permissions__codename", distinct=True, filter=Q(user_permissions__isnull=False)
+            ),
+        )
+
+    def get_access_names(self, user_id):
+        """Return a user's (group names, permission codenames), cached between token refreshes"""
+        def load():
+            names = self.with_access_names().filter(pk=user_id).values_list("group_names", "permission_codenames").first()
+            groups, permissions = names or (None, None)
+            return groups or [], permissions or []
+
+        return cache.get_or_set(access_names_cache_key(user_id), load, ACCESS_NAMES_CACHE_TIMEOUT)
+
 
 class User(AbstractBaseUser, PermissionsMixin):
     """Custom User model extending Django's AbstractBaseUser (no username field)"""
@@ -54,19 +97,41 @@ class User(AbstractBaseUser, PermissionsMixin):
     createdAt = models.DateTimeField(auto_now_add=True)
     updatedAt = models.DateTimeField(auto_now=True)
 
+    # Maintained by a database trigger from email, names, company name and role.
+    search_vector = SearchVectorField(null=True, editable=False)
+
     objects = CustomUserManager()
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["role", "is_active"], name="user_role_active_idx"),
+            GinIndex(fields=["search_vector"], name="user_search_vector_gin"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored password hash so save() can spot raw passwords without a query."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_password = instance.__dict__.get("password")
+        return instance
+
     def save(self, *args, **kwargs):
         """Ensure password is hashed when saving via Django Admin"""
-        if self.pk:
-            stored_user = User.objects.filter(pk=self.pk).first()
-            if stored_user and stored_user.password != self.password:
-                self.set_password(self.password)
+        loaded_password = getattr(self, "_loaded_password", None)
+        # set_password() records the raw value in _password, so an already hashed value is left alone.
+        if loaded_password is not None and self._password is None and self.password != loaded_password:
+            self.set_password(self.password)
 
         super().save(*args, **kwargs)
+        self._loaded_password = self.__dict__.get("password")
+
+    def create_profile(self):
+        """Create the profile that matches the user's role"""
+        profile_model = EmployerProfile if self.role == "employer" else UserProfile
+        return profile_model.objects.create(user=self)
 
     def __str__(self):
         return f"{self.email}"
@@ -87,6 +152,7 @@ class UserProfile(models.Model):
     
     experience_level = models.CharField(max_length=10, choices=EXPERIENCE_CHOICES, null=True, blank=True)
     social_media_links = models.JSONField(null=True, blank=True)  # Example: {"Twitter": "https://twitter.com/user"}
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"User Profile of {self.user.email}"
@@ -98,6 +164,7 @@ class EmployerProfile(models.Model):
     company_website = models.URLField(blank=True, null=True)
     company_description = models.TextField(blank=True, null=True)
     company_location = models.TextField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"Employer Profile of {self.user.email} ({self.user.company_name})"
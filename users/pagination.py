@@ -0,0 +1,41 @@
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from job_board_platform.caching import make_cache_key
+from jobs.pagination import CustomPagination
+
+USER_COUNT_CACHE_PREFIX = "usercount:"
+USER_COUNT_CACHE_TIMEOUT = 60
+
+
+def cached_count(key, compute, refresh=False):
+    """Return the cached result of a COUNT query, recomputing it when asked to or on a miss."""
+    if refresh:
+        value = compute()
+        cache.set(key, value, USER_COUNT_CACHE_TIMEOUT)
+        return value
+    return cache.get_or_set(key, compute, USER_COUNT_CACHE_TIMEOUT)
+
+
+class UserPagination(CustomPagination):
+    """
+    Custom pagination that caches the user COUNT(*) for each set of filters.
+
+    The first page always recounts, so a stale total corrects itself as soon
+    as the start of the list is loaded again.
+    """
+
+    def count_cache_key(self, request):
+        params = sorted(
+            (key, value) for key, value in request.query_params.items()
+            if key not in (self.page_query_param, self.page_size_query_param)
+        )
+        return make_cache_key(USER_COUNT_CACHE_PREFIX, "list", *params)
+
+    def django_paginator_class(self, object_list, per_page):
+        paginator = Paginator(object_list, per_page)
+        first_page = self.request.query_params.get(self.page_query_param, "1") == "1"
+        # Paginator.count is a cached_property, so seeding it skips the COUNT(*) query.
+        paginator.count = cached_count(
+            self.count_cache_key(self.request), object_list.count, refresh=first_page
+        )
+        return paginator
@@ -1,5 +1,7 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+SELF_MANAGED_ROLES = frozenset(("user", "employer"))
+
 class IsOwnerBasedOnRole(BasePermission):
     """
     Custom permission:
@@ -16,7 +18,7 @@ class IsOwnerBasedOnRole(BasePermission):
             return True
 
         # Users and employers can only modify their own data
-        return getattr(request.user, "role", None) in ["user", "employer"]
+        return getattr(request.user, "role", None) in SELF_MANAGED_ROLES
 
     def has_object_permission(self, request, view, obj):
         """
@@ -28,8 +30,8 @@ class IsOwnerBasedOnRole(BasePermission):
         if request.user.is_superuser:
             return True
 
-        if request.user.role in ["user", "employer"]:
-            return hasattr(obj, "user") and obj.user == request.user
+        if request.user.role in SELF_MANAGED_ROLES:
+            return getattr(obj, "user_id", None) == request.user.id
 
         return False
 
@@ -53,7 +55,7 @@ class CanCreateUserOrEmployer(BasePermission):
         if request.method == "POST":
             role = request.data.get("role", "").lower()
 
-            if role in ["user", "employer"]:
+            if role in SELF_MANAGED_ROLES:
                 return True
 
             if role == "admin":
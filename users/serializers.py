@@ -1,3 +1,4 @@
+from django.db import transaction
 from rest_framework import serializers
 from .models import UserProfile, User, EmployerProfile
 from rest_framework.exceptions import AuthenticationFailed, ValidationError
@@ -7,7 +8,7 @@ class UserSerializer(serializers.ModelSerializer):
     """Serializer for User model"""
     class Meta:
         model = User
-        fields = '__all__'
+        exclude = ["search_vector"]
         extra_kwargs = {
             'password': {'write_only': True},
             'email': {'required': True},
@@ -37,18 +38,17 @@ class UserSerializer(serializers.ModelSerializer):
         password = validated_data.pop('password')
         groups = validated_data.pop('groups', [])
         user_permissions = validated_data.pop('user_permissions', [])
-        user = User.objects.create_user(password=password, **validated_data) 
-        # user.set_password(password)
-        user.save()
-        user.groups.set(groups)
-        user.user_permissions.set(user_permissions)
+        with transaction.atomic():
+            user = User.objects.create_user(password=password, **validated_data)
+            user.groups.set(groups)
+            user.user_permissions.set(user_permissions)
         return user
     
 class UserProfileDisplaySerializer(serializers.ModelSerializer):
     """Serializer for User model"""
     class Meta:
         model = User
-        exclude = ["company_name", "industry", "groups", "user_permissions", "password", "createdAt"]
+        exclude = ["company_name", "industry", "groups", "user_permissions", "password", "createdAt", "search_vector"]
         extra_kwargs = {
             'updatedAt': {'read_only': True},
             'is_staff': {'read_only': True},
@@ -65,6 +65,13 @@ class UserProfileSerializer(serializers.ModelSerializer):
         model = UserProfile
         fields = '__all__'
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Load the nested user in the same query, skipping columns the display serializer excludes."""
+        return queryset.select_related("user").defer(
+            "user__password", "user__company_name", "user__industry", "user__createdAt", "user__search_vector"
+        )
+
     def update(self, instance, validated_data):
         """Update both User and UserProfile."""
         user_data = validated_data.pop("user", None)
@@ -73,11 +80,11 @@ class UserProfileSerializer(serializers.ModelSerializer):
         if user_data:
             for attr, value in user_data.items():
                 setattr(user_instance, attr, value)
-            user_instance.save()
+            user_instance.save(update_fields=[*user_data, "updatedAt"])
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        instance.save(update_fields=[*validated_data, "updated_at"])
 
         return instance
     
@@ -85,7 +92,7 @@ class EmployerProfileDisplaySerializer(serializers.ModelSerializer):
     """Serializer for User model"""
     class Meta:
         model = User
-        exclude = ["groups", "user_permissions", "password", "createdAt"]
+        exclude = ["groups", "user_permissions", "password", "createdAt", "search_vector"]
         extra_kwargs = {
             'updatedAt': {'read_only': True},
             'is_staff': {'read_only': True},
@@ -103,6 +110,11 @@ class EmployerProfileSerializer(serializers.ModelSerializer):
         model = EmployerProfile
         fields = '__all__'
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Load the nested user in the same query, skipping columns the display serializer excludes."""
+        return queryset.select_related("user").defer("user__password", "user__createdAt", "user__search_vector")
+
     def update(self, instance, validated_data):
         """Update both Employer and EmployerProfile."""
         user_data = validated_data.pop("user", None)
@@ -111,14 +123,20 @@ class EmployerProfileSerializer(serializers.ModelSerializer):
         if user_data:
             for attr, value in user_data.items():
                 setattr(user_instance, attr, value)
-            user_instance.save()
+            user_instance.save(update_fields=[*user_data, "updatedAt"])
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        instance.save(update_fields=[*validated_data, "updated_at"])
 
         return instance
 
+# Columns needed to check credentials and build the login token claims.
+TOKEN_USER_FIELDS = (
+    "id", "email", "password", "first_name", "last_name", "phone", "role",
+    "company_name", "industry", "is_active", "is_staff", "is_superuser",
+)
+
 class CustomTokenObtainPairSerializer(serializers.Serializer):
     """Serializer for the CustomTokenObtainPairView"""
     email = serializers.EmailField()
@@ -132,7 +150,7 @@ class CustomTokenObtainPairSerializer(serializers.Serializer):
             raise AuthenticationFailed('Email and password are required.')
 
         try:
-            user = User.objects.get(email=email)
+            user = User.objects.with_access_names().only(*TOKEN_USER_FIELDS).get(email=email)
         except User.DoesNotExist:
             raise AuthenticationFailed('User with this email does not exist.')
         
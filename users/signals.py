@@ -1,11 +1,72 @@
-from django.db.models.signals import post_save, post_delete
+from functools import partial
+from django.core.cache import cache
+from django.db import transaction
+from django.contrib.auth.models import Group, Permission
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
-from .models import User, UserProfile, EmployerProfile
+from .models import User, access_names_cache_key
+from .pagination import USER_COUNT_CACHE_PREFIX
+from .tasks.email_tasks import send_welcome_email, send_employer_welcome_email
+
+def dispatch_welcome_email(user):
+    """Queue the welcome email that matches the user's role; admins get none."""
+    if user.role == "user":
+        send_welcome_email.delay(user.email, user.first_name)
+    elif user.role == "employer":
+        send_employer_welcome_email.delay(user.email, user.company_name)
+
+@receiver(post_save, sender=User)
+def send_welcome_email_on_signup(sender, instance, created, raw=False, **kwargs):
+    """Send the welcome email once the new user's row is committed, so the worker can never miss it."""
+    if created and not raw:
+        transaction.on_commit(partial(dispatch_welcome_email, instance))
 
 @receiver(post_save, sender=User)
-def create_profile(sender, instance, created, **kwargs):
-    if created:
-        if instance.role == 'employer':
-            EmployerProfile.objects.get_or_create(user=instance)
-        else:
-            UserProfile.objects.get_or_create(user=instance)
+@receiver(post_delete, sender=User)
+def clear_user_count_cache(sender, instance, **kwargs):
+    """Drop cached user totals so admin listings pick up the change."""
+    cache.delete_pattern(f"{USER_COUNT_CACHE_PREFIX}*")
+
+def clear_access_names_for(user_ids):
+    if user_ids:
+        cache.delete_many([access_names_cache_key(user_id) for user_id in user_ids])
+
+def member_ids(instance):
+    """Ids of the users holding a Group or Permission."""
+    return list(instance.user_set.values_list("pk", flat=True))
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def clear_access_names_cache(sender, instance, action, reverse, pk_set, **kwargs):
+    """Drop cached token claims when a user's groups or permissions change."""
+    if action == "pre_clear" and reverse:
+        # A reverse clear (group.user_set.clear()) sends no pk_set, so remember the members first.
+        instance._access_names_user_ids = member_ids(instance)
+        return
+
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        cache.delete(access_names_cache_key(instance.pk))
+    elif action == "post_clear":
+        clear_access_names_for(instance.__dict__.pop("_access_names_user_ids", None))
+    else:
+        clear_access_names_for(pk_set)
+
+@receiver(post_save, sender=Group)
+def clear_group_access_names_cache(sender, instance, created, **kwargs):
+    """A renamed group changes the names cached for every member."""
+    if not created:
+        clear_access_names_for(member_ids(instance))
+
+@receiver(pre_delete, sender=Group)
+@receiver(pre_delete, sender=Permission)
+def remember_access_names_members(sender, instance, **kwargs):
+    # The membership rows are cascade-deleted without m2m_changed, so collect the members beforehand.
+    instance._access_names_user_ids = member_ids(instance)
+
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=Permission)
+def clear_deleted_access_names_cache(sender, instance, **kwargs):
+    clear_access_names_for(instance.__dict__.pop("_access_names_user_ids", None))
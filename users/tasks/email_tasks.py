@@ -1,96 +1,170 @@
+import json
 import logging
 from celery import shared_task
-from django.core.mail import EmailMultiAlternatives
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.conf import settings
-from django.utils.html import strip_tags
-from django.template.loader import render_to_string
+from django.template.loader import get_template
+from django_redis import get_redis_connection
+from redis.exceptions import LockError
+from functools import lru_cache
 import datetime
 
 logger = logging.getLogger(__name__)
 
+# Welcome emails are queued in Redis and sent in batches over one SMTP connection.
+EMAIL_OUTBOX_KEY = "email:outbox"
+# Entries being sent are parked here and removed one by one once delivered (or re-queued).
+EMAIL_PROCESSING_KEY = "email:outbox:processing"
+EMAIL_FLUSH_LOCK_KEY = "email:outbox:lock"
+EMAIL_OUTBOX_BATCH_SIZE = 100
+EMAIL_OUTBOX_MAX_ATTEMPTS = 3
+# Sending one message takes at most this many SMTP round trips (MAIL, RCPT, DATA, body),
+# each bounded by EMAIL_TIMEOUT; one more batch slot covers connecting and logging in.
+EMAIL_SMTP_ROUND_TRIPS = 4
+EMAIL_FLUSH_LOCK_TIMEOUT = (EMAIL_OUTBOX_BATCH_SIZE + 1) * EMAIL_SMTP_ROUND_TRIPS * settings.EMAIL_TIMEOUT
+
+
+@lru_cache(maxsize=None)
+def _get_email_template(template_name):
+    """Load and compile an email template once per worker process."""
+    return get_template(template_name)
+
+
+def build_welcome_email(recipient_email: str, first_name: str) -> EmailMultiAlternatives:
+    """Build the styled welcome email for a new user."""
+    # Context for template rendering
+    context = {
+        'first_name': first_name,
+        'support_email': settings.SUPPORT_EMAIL,
+        'company_name': "JobNest",
+        'current_year': datetime.datetime.now().year
+    }
+
+    email = EmailMultiAlternatives(
+        subject="🎉 Welcome to JobNest - Find your desired jobs with ease!",
+        body=_get_email_template('emails/welcome.txt').render(context),
+        from_email=f"JobNest Team <{settings.DEFAULT_FROM_EMAIL}>",
+        to=[recipient_email],
+        reply_to=[settings.EMAIL_HOST_USER]
+    )
+    email.attach_alternative(_get_email_template('emails/welcome.html').render(context), "text/html")
+
+    # Add email headers for analytics
+    email.extra_headers = {
+        'X-Email-Category': 'Welcome',
+        'X-Email-Type': 'Transactional'
+    }
+    return email
+
+
+def build_employer_welcome_email(recipient_email: str, company_name: str) -> EmailMultiAlternatives:
+    """Build the styled welcome email for a new employer."""
+    # Context for template rendering
+    context = {
+        'company_name': company_name,
+        'support_email': settings.SUPPORT_EMAIL,
+        'platform_name': "JobNest",
+        'current_year': datetime.datetime.now().year
+    }
+
+    email = EmailMultiAlternatives(
+        subject="🚀 Welcome to JobNest - Start Hiring the Best Talent!",
+        body=_get_email_template('emails/employer_welcome.txt').render(context),
+        from_email=f"JobNest Team <{settings.DEFAULT_FROM_EMAIL}>",
+        to=[recipient_email],
+        reply_to=[settings.EMAIL_HOST_USER]
+    )
+    email.attach_alternative(_get_email_template('emails/employer_welcome.html').render(context), "text/html")
+
+    email.extra_headers = {
+        'X-Email-Category': 'Employer Welcome',
+        'X-Email-Type': 'Transactional'
+    }
+    return email
+
+
+EMAIL_BUILDERS = {
+    "welcome": build_welcome_email,
+    "employer_welcome": build_employer_welcome_email,
+}
+
+
+def _email_entry(kind: str, recipient_email: str, name: str, attempts: int = 0) -> str:
+    return json.dumps([kind, recipient_email, name, attempts])
+
+
+def queue_email(kind: str, recipient_email: str, name: str, attempts: int = 0) -> None:
+    get_redis_connection("default").rpush(EMAIL_OUTBOX_KEY, _email_entry(kind, recipient_email, name, attempts))
+
+
 @shared_task(bind=True, max_retries=3, autoretry_for=(Exception,), retry_backoff=True)
 def send_welcome_email(self, recipient_email: str, first_name: str) -> None:
-    """Asynchronously sends a styled welcome email to new users with retry capabilities."""
-    try:
-        # Email configuration
-        subject = "🎉 Welcome to JobNest - Find your desired jobs with ease!"
-        from_email = f"JobNest Team <{settings.DEFAULT_FROM_EMAIL}>"
-        
-        # Context for template rendering
-        context = {
-            'first_name': first_name,
-            'support_email': settings.SUPPORT_EMAIL,
-            'company_name': "JobNest",
-            'current_year': datetime.datetime.now().year
-        }
-
-        html_content = render_to_string('emails/welcome.html', context)
-        
-        # Create plain text version by stripping HTML tags
-        text_content = strip_tags(html_content)
-
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=text_content,
-            from_email=from_email,
-            to=[recipient_email],
-            reply_to=[settings.EMAIL_HOST_USER]
-        )
-        email.attach_alternative(html_content, "text/html")
-        
-        # Add email headers for analytics
-        email.extra_headers = {
-            'X-Email-Category': 'Welcome',
-            'X-Email-Type': 'Transactional'
-        }
-
-        email.send(fail_silently=False)
-        
-        logger.info(f"Successfully sent welcome email to {recipient_email}")
-        
-    except Exception as e:
-        logger.error(f"Failed to send welcome email to {recipient_email}: {str(e)}")
-        raise self.retry(exc=e, countdown=2 ** self.request.retries)
-    
+    """Queues a styled welcome email to a new user for the next outbox flush."""
+    queue_email("welcome", recipient_email, first_name)
+
 
 @shared_task(bind=True, max_retries=3, autoretry_for=(Exception,), retry_backoff=True)
 def send_employer_welcome_email(self, recipient_email: str, company_name: str) -> None:
-    """Asynchronously sends a styled welcome email to new employers with retry capabilities."""
+    """Queues a styled welcome email to a new employer for the next outbox flush."""
+    queue_email("employer_welcome", recipient_email, company_name)
+
+
+def _acknowledge(redis, entry, retry_entry=None) -> None:
+    """Remove a handled entry from the processing list, re-queuing its retry in the same transaction."""
+    with redis.pipeline() as pipe:
+        if retry_entry is not None:
+            pipe.rpush(EMAIL_OUTBOX_KEY, retry_entry)
+        pipe.lrem(EMAIL_PROCESSING_KEY, 1, entry)
+        pipe.execute()
+
+
+@shared_task(ignore_result=True)
+def flush_email_outbox() -> None:
+    """Send queued welcome emails over a single SMTP connection.
+
+    Each entry is moved to a processing list before it is sent and acknowledged right after,
+    so a failure re-queues only the unsent message and a worker that dies mid-batch loses nothing:
+    the next flush returns its leftovers to the outbox.
+    """
+    redis = get_redis_connection("default")
+    # redis-py's Lock stores a unique token and releases with a compare-and-delete script,
+    # so a flush can never drop a lock that has since passed to another flush.
+    lock = redis.lock(EMAIL_FLUSH_LOCK_KEY, timeout=EMAIL_FLUSH_LOCK_TIMEOUT)
+    if not lock.acquire(blocking=False):
+        return
+
     try:
-        subject = "🚀 Welcome to JobNest - Start Hiring the Best Talent!"
-        from_email = f"JobNest Team <{settings.DEFAULT_FROM_EMAIL}>"
-        
-        # Context for template rendering
-        context = {
-            'company_name': company_name,
-            'support_email': settings.SUPPORT_EMAIL,
-            'platform_name': "JobNest",
-            'current_year': datetime.datetime.now().year
-        }
-
-        html_content = render_to_string('emails/employer_welcome.html', context)
-        
-        # Create plain text version by stripping HTML tags
-        text_content = strip_tags(html_content)
-
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=text_content,
-            from_email=from_email,
-            to=[recipient_email],
-            reply_to=[settings.EMAIL_HOST_USER]
-        )
-        email.attach_alternative(html_content, "text/html")
-        
-        email.extra_headers = {
-            'X-Email-Category': 'Employer Welcome',
-            'X-Email-Type': 'Transactional'
-        }
-
-        email.send(fail_silently=False)
-        
-        logger.info(f"Successfully sent employer welcome email to {recipient_email}")
-        
-    except Exception as e:
-        logger.error(f"Failed to send employer welcome email to {recipient_email}: {str(e)}")
-        raise self.retry(exc=e, countdown=2 ** self.request.retries)
+        # Only one flush runs at a time, so anything still processing was abandoned by a dead worker.
+        while redis.lmove(EMAIL_PROCESSING_KEY, EMAIL_OUTBOX_KEY, "RIGHT", "LEFT"):
+            pass
+        if not redis.llen(EMAIL_OUTBOX_KEY):
+            return
+
+        sent = 0
+        with get_connection(fail_silently=False) as connection:
+            for _ in range(EMAIL_OUTBOX_BATCH_SIZE):
+                entry = redis.lmove(EMAIL_OUTBOX_KEY, EMAIL_PROCESSING_KEY, "LEFT", "RIGHT")
+                if entry is None:
+                    break
+
+                kind, recipient_email, name, attempts = json.loads(entry)
+                try:
+                    connection.send_messages([EMAIL_BUILDERS[kind](recipient_email, name)])
+                except Exception:
+                    logger.exception("Failed to send %s email to %s", kind, recipient_email)
+                    if attempts + 1 < EMAIL_OUTBOX_MAX_ATTEMPTS:
+                        _acknowledge(redis, entry, _email_entry(kind, recipient_email, name, attempts + 1))
+                    else:
+                        logger.error("Dropping %s email to %s after %s attempts", kind, recipient_email, attempts + 1)
+                        _acknowledge(redis, entry)
+                    continue
+
+                _acknowledge(redis, entry)
+                sent += 1
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            logger.warning("Email outbox lock expired before the flush finished")
+
+    logger.info("Successfully sent %s queued emails", sent)
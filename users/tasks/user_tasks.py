@@ -0,0 +1,9 @@
+from celery import shared_task
+from django.utils.dateparse import parse_datetime
+from users.models import User
+
+
+@shared_task(ignore_result=True)
+def update_last_login(user_id: int, timestamp: str) -> None:
+    """Record a user's login time outside the request cycle."""
+    User.objects.filter(pk=user_id).update(last_login=parse_datetime(timestamp))
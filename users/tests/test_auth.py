@@ -1,155 +1,198 @@
 import pytest
+from unittest.mock import Mock
 from django.contrib.auth import get_user_model
-from rest_framework.test import APIClient
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group
+from rest_framework.test import APIClient, APIRequestFactory
 from rest_framework import status
 from django.urls import reverse
 from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from users.auth import UserCreateView, CustomTokenRefreshView
 
 User = get_user_model()
 
+TOKEN_URL = reverse("token_obtain_pair")
+REFRESH_URL = reverse("token_refresh")
+SIGNUP_URL = reverse("sign_up_new_account")
+LOGOUT_URL = reverse("logout_user")
+USER_LIST_URL = reverse("user-list")
+
+# Validation-only tests call these views directly, skipping URL resolution and middleware.
+signup_view = UserCreateView.as_view()
+token_refresh_view = CustomTokenRefreshView.as_view()
+
 @pytest.fixture
 def api_client():
     return APIClient()
 
 @pytest.fixture
-def user(db):
+def api_factory():
+    return APIRequestFactory()
+
+@pytest.fixture(autouse=True)
+def celery_tasks(monkeypatch):
+    """Stub out task dispatch so signup and login tests never reach the Celery broker."""
+    tasks = {
+        "send_welcome_email": "users.signals",
+        "send_employer_welcome_email": "users.signals",
+        "update_last_login": "users.auth",
+    }
+    delays = {name: Mock() for name in tasks}
+    for name, module in tasks.items():
+        monkeypatch.setattr(f"{module}.{name}.delay", delays[name])
+    return delays
+
+@pytest.fixture(scope="module")
+def auth_users(django_db_setup, django_db_blocker):
+    """Create the test users once per module; each test still runs in its own rolled-back transaction."""
+    password = make_password("securepassword")
+    users = {
+        "user": User(
+            email="testuser@example.com",
+            password=password,
+            first_name="John",
+            last_name="Doe",
+            role="user",
+            phone="1234567890"
+        ),
+        "user2": User(
+            email="testuser2@example.com",
+            password=make_password("securepassword2"),
+            first_name="Frank",
+            last_name="Mark",
+            role="user",
+            phone="1234567890"
+        ),
+        "employer": User(
+            email="employer@example.com",
+            password=password,
+            first_name="Jane",
+            last_name="Smith",
+            role="employer",
+            phone="0987654321",
+            company_name="TechCorp",
+            industry="IT"
+        ),
+    }
+    emails = [user.email for user in users.values()]
+    with django_db_blocker.unblock():
+        # These rows are committed, so clear any left behind by an interrupted run of the reused test database.
+        User.objects.filter(email__in=emails).delete()
+        User.objects.bulk_create_users(list(users.values()))
+    try:
+        yield users
+    finally:
+        with django_db_blocker.unblock():
+            User.objects.filter(email__in=emails).delete()
+
+@pytest.fixture
+def user(auth_users):
     """Fixture to create a test user."""
-    return User.objects.create_user(
-        email="testuser@example.com",
-        password="securepassword",
-        first_name="John",
-        last_name="Doe",
-        role="user",
-        phone="1234567890"
-    )
+    return auth_users["user"]
 
 @pytest.fixture
-def user2(db):
+def user2(auth_users):
     """Fixture to create a test second user."""
-    return User.objects.create_user(
-        email="testuser2@example.com",
-        password="securepassword2",
-        first_name="Frank",
-        last_name="Mark",
-        role="user",
-        phone="1234567890"
-    )
+    return auth_users["user2"]
 
 @pytest.fixture
-def employer(db):
+def employer(auth_users):
     """Fixture to create a test employer."""
-    return User.objects.create_user(
-        email="employer@example.com",
-        password="securepassword",
-        first_name="Jane",
-        last_name="Smith",
-        role="employer",
-        phone="0987654321",
-        company_name="TechCorp",
-        industry="IT"
-    )
+    return auth_users["employer"]
 
-@pytest.fixture
-def generate_tokens(user):
-    """Generate JWT tokens for the test user."""
-    refresh = RefreshToken.for_user(user)
-    return {
-        "access_token": str(refresh.access_token),
-        "refresh_token": str(refresh)
-    }
+@pytest.fixture(scope="module")
+def generate_tokens(auth_users, django_db_blocker):
+    """Generate JWT tokens for the test user once per module; blacklisting in a test is rolled back with it."""
+    with django_db_blocker.unblock():
+        refresh = RefreshToken.for_user(auth_users["user"])
+    try:
+        yield {
+            "access_token": str(refresh.access_token),
+            "refresh_token": str(refresh)
+        }
+    finally:
+        # Outstanding tokens outlive their user (the FK is SET_NULL), so remove this one explicitly.
+        with django_db_blocker.unblock():
+            OutstandingToken.objects.filter(jti=refresh["jti"]).delete()
 
 @pytest.mark.django_db
 class TestAuthentication:
     
     def test_login_missing_credentials(self, api_client):
-        url = reverse("token_obtain_pair")
-        response = api_client.post(url, {"email": "test@example.com"})
+        response = api_client.post(TOKEN_URL, {"email": "test@example.com"})
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     def test_login_wrong_password(self, api_client, user):
-        url = reverse("token_obtain_pair")
-        response = api_client.post(url, {"email": user.email, "password": "wrongpassword"})
+        response = api_client.post(TOKEN_URL, {"email": user.email, "password": "wrongpassword"})
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
     
     def test_user_can_obtain_token(self, api_client, user):
-        url = reverse("token_obtain_pair")
         payload = {"email": user.email, "password": "securepassword"}
-        response = api_client.post(url, payload)
+        response = api_client.post(TOKEN_URL, payload)
         assert response.status_code == status.HTTP_200_OK
         assert "access_token" in response.data
         assert "refresh_token" in response.data
         assert "user" in response.data
     
     def test_invalid_user_cannot_obtain_token(self, api_client):
-        url = reverse("token_obtain_pair")
         payload = {"email": "wrong@example.com", "password": "wrongpassword"}
-        response = api_client.post(url, payload)
+        response = api_client.post(TOKEN_URL, payload)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 @pytest.mark.django_db
 class TestToken:
     
-    def test_token_refresh_missing_token(self, api_client):
-        url = reverse("token_refresh")
-        response = api_client.post(url, {})
+    def test_token_refresh_missing_token(self, api_factory):
+        response = token_refresh_view(api_factory.post(REFRESH_URL, {}))
         assert response.status_code == status.HTTP_400_BAD_REQUEST
     
     def test_token_refresh(self, api_client, generate_tokens):
-        url = reverse("token_refresh")
         payload = {"refresh_token": generate_tokens["refresh_token"]}
-        response = api_client.post(url, payload)
+        response = api_client.post(REFRESH_URL, payload)
         assert response.status_code == status.HTTP_200_OK
         assert "access_token" in response.data
     
     def test_invalid_refresh_token(self, api_client):
-        url = reverse("token_refresh")
         payload = {"refresh_token": "invalid_token"}
-        response = api_client.post(url, payload)
+        response = api_client.post(REFRESH_URL, payload)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
     
     def test_logout_invalidates_refresh_token(self, api_client, generate_tokens):
-        url = reverse("logout_user")
         api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_tokens['access_token']}")
-        response = api_client.post(url, {"refresh_token": generate_tokens["refresh_token"]})
+        response = api_client.post(LOGOUT_URL, {"refresh_token": generate_tokens["refresh_token"]})
         assert response.status_code == status.HTTP_205_RESET_CONTENT
-        refresh_url = reverse("token_refresh")
-        response = api_client.post(refresh_url, {"refresh_token": generate_tokens["refresh_token"]})
+        response = api_client.post(REFRESH_URL, {"refresh_token": generate_tokens["refresh_token"]})
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 @pytest.mark.django_db
 class TestUserManagement:
     
     def test_user_creation(self, api_client):
-        url = reverse("sign_up_new_account")
         payload = {"email": "newuser@example.com", "password": "securepassword", "first_name": "Alice", "last_name": "Johnson", "role": "user", "phone": "5555555555"}
-        response = api_client.post(url, payload)
+        response = api_client.post(SIGNUP_URL, payload)
         assert response.status_code == status.HTTP_201_CREATED
 
-    def test_user_creation_missing_fields(self, api_client):
+    def test_user_creation_missing_fields(self, api_factory):
         """Test user creation fails when required fields are missing."""
-        url = reverse("sign_up_new_account")
-
-        response = api_client.post(url, {})
+        response = signup_view(api_factory.post(SIGNUP_URL, {}))
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "email" in response.data
         assert "password" in response.data
     
     def test_duplicate_user_creation(self, api_client, user):
-        url = reverse("sign_up_new_account")
         payload = {"email": user.email, "password": "newpassword", "first_name": "Duplicate", "last_name": "User", "role": "user", "phone": "6666666666"}
-        response = api_client.post(url, payload)
+        response = api_client.post(SIGNUP_URL, payload)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     def test_employer_has_additional_fields(self, api_client, employer):
         """Test that employer users have additional fields in their token."""
-        url = reverse("token_obtain_pair")
-
         payload = {
             "email": employer.email,
             "password": "securepassword"
         }
 
-        response = api_client.post(url, payload)
+        response = api_client.post(TOKEN_URL, payload)
 
         assert response.status_code == status.HTTP_200_OK
         assert "access_token" in response.data
@@ -159,8 +202,6 @@ class TestUserManagement:
 
     def test_admin_account_cannot_be_created_by_user_or_employer(self, api_client):
         """Test that admin account cannot be created by user or an employer"""
-        url = reverse("sign_up_new_account")
-
         payload = {
             "email":"admin@gmail.com",
             "password": "newpassword",
@@ -170,35 +211,33 @@ class TestUserManagement:
             "phone": "6666666666"
         }
 
-        response = api_client.post(url, payload)
+        response = api_client.post(SIGNUP_URL, payload)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_employer_signup_missing_industry_field(self, api_client):
+    def test_employer_signup_missing_industry_field(self, api_factory):
         """Test employer signup fails if required industry field is missing."""
-        url = reverse("sign_up_new_account")
         payload = {
-            "email": "employer@example.com",
+            "email": "newemployer@example.com",
             "password": "securepassword",
             "role": "employer",
             "company_name": "is Lord Enterprise"
         }
         
-        response = api_client.post(url, payload)
+        response = signup_view(api_factory.post(SIGNUP_URL, payload))
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "industry" in response.data
         
-    def test_employer_signup_missing_company_name_field(self, api_client):
+    def test_employer_signup_missing_company_name_field(self, api_factory):
         """Test employer signup fails if required company_name field is missing."""
-        url = reverse("sign_up_new_account")
         payload = {
-            "email": "employer@example.com",
+            "email": "newemployer@example.com",
             "password": "securepassword",
             "role": "employer",
             "industry": "Tech"
         }
         
-        response = api_client.post(url, payload)
+        response = signup_view(api_factory.post(SIGNUP_URL, payload))
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "company_name" in response.data
 
@@ -206,10 +245,34 @@ class TestUserManagement:
 class TestAccessControl:
     
     def test_protected_route_requires_authentication(self, api_client):
-        url = reverse("user-list")
-        response = api_client.get(url)
+        response = api_client.get(USER_LIST_URL)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
     
+    def test_admin_can_search_users_by_name_prefix(self, api_client, user, employer):
+        admin = User.objects.create_superuser(email="admin@example.com", password="securepassword")
+        api_client.force_authenticate(user=admin)
+        response = api_client.get(USER_LIST_URL, {"search": "jo"})
+        assert response.status_code == status.HTTP_200_OK
+        assert [row["email"] for row in response.json()["results"]] == [user.email]
+
+    def test_unchanged_profile_returns_not_modified(self, api_client, user, generate_tokens):
+        url = reverse("userprofile_detail", args=[user.id])
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_tokens['access_token']}")
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_profile_etag_depends_on_accepted_media_type(self, api_client, user, generate_tokens):
+        url = reverse("userprofile_detail", args=[user.id])
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_tokens['access_token']}")
+        response = api_client.get(url, HTTP_ACCEPT="application/json")
+        assert "Accept" in response["Vary"]
+
+        response = api_client.get(url, HTTP_ACCEPT="text/html", HTTP_IF_NONE_MATCH=response["ETag"])
+        assert response.status_code == status.HTTP_200_OK
+
     def test_user_cannot_access_other_users_data(self, api_client, user2, generate_tokens):
         url = reverse("userprofile_detail", args=[user2.id])
         api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_tokens['access_token']}")
@@ -221,3 +284,27 @@ class TestAccessControl:
         api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {generate_tokens['access_token']}")
         response = api_client.get(url)
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestAccessNamesCache:
+
+    def test_reverse_clear_drops_cached_groups(self, user):
+        group = Group.objects.create(name="reviewers")
+        user.groups.add(group)
+        assert User.objects.get_access_names(user.id)[0] == ["reviewers"]
+
+        group.user_set.clear()
+        assert User.objects.get_access_names(user.id)[0] == []
+
+    def test_group_rename_and_delete_drop_cached_groups(self, user):
+        group = Group.objects.create(name="reviewers")
+        user.groups.add(group)
+        User.objects.get_access_names(user.id)
+
+        group.name = "editors"
+        group.save()
+        assert User.objects.get_access_names(user.id)[0] == ["editors"]
+
+        group.delete()
+        assert User.objects.get_access_names(user.id)[0] == []
@@ -1,9 +1,16 @@
 from .models import User, UserProfile, EmployerProfile
 from .serializers import UserSerializer, UserProfileSerializer, EmployerProfileSerializer
-from rest_framework import generics, viewsets, filters
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import generics, viewsets, status
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
 from users.permissions import IsOwnerBasedOnRole, IsOnlyAdmin
-from jobs.pagination import CustomPagination
-from drf_yasg import openapi
+from job_board_platform.filters import SearchVectorFilter
+from job_board_platform.renderers import OrjsonRenderer
+from job_board_platform.swagger import MESSAGE_RESPONSE, ERROR_RESPONSE
+from .pagination import UserPagination
 from drf_yasg.utils import swagger_auto_schema
 
 class UserViewSet(viewsets.ModelViewSet):
@@ -11,9 +18,16 @@ class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all().order_by("-createdAt")
     serializer_class = UserSerializer
     permission_classes = [IsOnlyAdmin]
-    filter_backends = [filters.SearchFilter]
-    search_fields = ["email", "role", "company_name", "username", "first_name", "last_name"]
-    pagination_class = CustomPagination
+    filter_backends = [SearchVectorFilter]
+    pagination_class = UserPagination
+    renderer_classes = [OrjsonRenderer, BrowsableAPIRenderer]
+
+    def get_queryset(self):
+        queryset = super().get_queryset().defer("search_vector").prefetch_related("groups", "user_permissions")
+        if self.request.method in SAFE_METHODS:
+            # The password hash is write-only, so reads never need it.
+            queryset = queryset.defer("password")
+        return queryset
 
     @swagger_auto_schema(
         operation_summary="Admin API for Listing all Users",
@@ -32,11 +46,7 @@ class UserViewSet(viewsets.ModelViewSet):
         operation_summary="Admin API for Creating new user",
         operation_description="API for admin to create new user. Only admin have priviledge",
         request_body=UserSerializer,
-        responses={
-             201: openapi.Response("Account created successfully.", schema=openapi.Schema(type=openapi.TYPE_OBJECT, properties={"message": openapi.Schema(type=openapi.TYPE_STRING)})),
-            400: openapi.Response("Validation error (e.g., already created).", schema=openapi.Schema(type=openapi.TYPE_OBJECT, properties={"error": openapi.Schema(type=openapi.TYPE_STRING)})),
-        
-        }
+        responses={201: MESSAGE_RESPONSE, 400: ERROR_RESPONSE}
     )
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
@@ -75,7 +85,30 @@ class UserViewSet(viewsets.ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         return super().destroy(request, *args, **kwargs)
 
-class UserProfileDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ProfileETagMixin:
+    """Answer repeated profile GETs with 304 Not Modified while neither the profile nor its user changed."""
+
+    def retrieve(self, request, *args, **kwargs):
+        # get_object() still runs the object permission check before anything is revealed.
+        instance = self.get_object()
+        # The JSON and browsable API renderings of a profile differ, so each media type gets its own tag.
+        etag = quote_etag(
+            f"{instance.updated_at.timestamp()}-{instance.user.updatedAt.timestamp()}-{request.accepted_renderer.format}"
+        )
+        if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+
+        if "*" in if_none_match or etag in if_none_match or f"W/{etag}" in if_none_match:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(self.get_serializer(instance).data)
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Accept"])
+        # Clients may keep the body but must revalidate, so an edit shows up on the next GET.
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class UserProfileDetailView(ProfileETagMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update, or delete a user's full profile.
 
@@ -87,8 +120,12 @@ class UserProfileDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = UserProfile.objects.all()
     serializer_class = UserProfileSerializer
     lookup_field = "user"
+    renderer_classes = [OrjsonRenderer, BrowsableAPIRenderer]
     permission_classes = [IsOwnerBasedOnRole]
 
+    def get_queryset(self):
+        return UserProfileSerializer.setup_eager_loading(super().get_queryset())
+
     @swagger_auto_schema(
         operation_summary="Retrieve a user's profile",
         operation_description="Retrieve a user's profile by user ID.",
@@ -136,7 +173,7 @@ class UserProfileDetailView(generics.RetrieveUpdateDestroyAPIView):
         return super().delete(request, *args, **kwargs)
 
 
-class EmployerProfileDetailView(generics.RetrieveUpdateDestroyAPIView):
+class EmployerProfileDetailView(ProfileETagMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update, or delete an employer's full profile.
 
@@ -148,8 +185,12 @@ class EmployerProfileDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = EmployerProfile.objects.all()
     serializer_class = EmployerProfileSerializer
     lookup_field = "user"
+    renderer_classes = [OrjsonRenderer, BrowsableAPIRenderer]
     permission_classes = [IsOwnerBasedOnRole]
 
+    def get_queryset(self):
+        return EmployerProfileSerializer.setup_eager_loading(super().get_queryset())
+
     @swagger_auto_schema(
         operation_summary="Retrieve an employer's profile",
         operation_description=(